@@ -7,7 +7,7 @@ import os # For os.path.join
 from pathlib import Path # Import Path
 
 # Import the decentralized modules
-from gui.cleanvidgui_config import ConfigManager, DEFAULT_CONFIG
+from gui.cleanvidgui_config import ConfigManager, DEFAULT_CONFIG, _HOME
 from gui.cleanvidgui_main_frame import CleanVidMainFrame # Will import this once created
 
 APP_NAME = "CleanVid GUI"
@@ -49,25 +49,27 @@ class CleanVidGUIApp(TkinterDnD.Tk): # Inherit from TkinterDnD.Tk instead of ctk
         self.main_frame.pack(fill="both", expand=True, padx=10, pady=10)
 
         # --- Load Pending Queue ---
-        if hasattr(self.main_frame, 'queue_frame') and self.main_frame.queue_frame:
-            loaded_queue_items = self._app_config.get("pending_queue", [])
-            if loaded_queue_items: # Only repopulate if there's something to load
-                self.main_frame.queue_frame.repopulate_from_saved(loaded_queue_items)
-                self.main_frame.queue_frame.action_output_frame.update_clean_button_state() # Ensure button reflects loaded queue
-            # Clear from live config immediately after attempting to load
-            self._app_config["pending_queue"] = []
-        else:
-            print("Warning: QueueFrame not available on main_frame during init for queue loading.")
+        # The queue panel is built on the first idle cycle, so repopulate it once it exists
+        self.main_frame.when_ready(self._load_pending_queue)
 
 
         # --- Bindings ---
         # Save configuration when the window is closed
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
+        # Subprocess output is pumped into the console by the action/output frame (see drain_output)
 
-        # Start the periodic check for the output queue (even if main_frame isn't fully built yet)
-        # This ensures the queue processing is running once the action/output frame is added
-        self.after(100, self.process_output_queue)
 
+    def _load_pending_queue(self):
+        """Restores the queue saved in the config, opening the queue panel only if there is one."""
+        loaded_queue_items = self._app_config.get("pending_queue", [])
+        if loaded_queue_items: # Only build and repopulate the queue panel if there's something to load
+            queue_frame = self.main_frame.open_queue()
+            # Hands the list over: the queue keeps and modifies these item dicts without copying them,
+            # so nothing here may touch them afterwards (the config entry is reset just below)
+            queue_frame.repopulate_from_saved(loaded_queue_items, self._app_config.get("pending_queue_counter"))
+            queue_frame.action_output_frame.update_clean_button_state() # Ensure button reflects loaded queue
+        # Clear from live config immediately after attempting to load
+        self._app_config["pending_queue"] = []
 
     def on_closing(self):
         """Handles the window closing event, saves config, and destroys the window."""
@@ -95,14 +97,18 @@ class CleanVidGUIApp(TkinterDnD.Tk): # Inherit from TkinterDnD.Tk instead of ctk
             if hasattr(self.main_frame, 'queue_frame') and self.main_frame.queue_frame:
                 persistable_queue = self.main_frame.queue_frame.get_persistable_queue()
                 current_state_to_save["pending_queue"] = persistable_queue
-            else: # Ensure pending_queue is at least an empty list if queue_frame wasn't available
-                current_state_to_save["pending_queue"] = []
+                current_state_to_save["pending_queue_counter"] = self.main_frame.queue_frame.item_id_counter
+            else: # Queue frame never got built; keep whatever was still pending in the config
+                current_state_to_save["pending_queue"] = self._app_config.get("pending_queue", [])
+                current_state_to_save["pending_queue_counter"] = self._app_config.get("pending_queue_counter")
 
 
             # Add last used directory values from the live config manager's config
             # This ensures these are preserved even if other parts fail to load/save
-            for key in ["last_input_dir", "last_output_dir", "last_swears_dir", "last_subs_dir"]:
-                 current_state_to_save[key] = self.config_manager.config.get(key, DEFAULT_CONFIG.get(key, str(Path.home())))
+            self.config_manager.flush_last_dirs() # Per-dialog directories picked this session
+            for key in ["last_input_dir", "last_output_dir", "last_swears_dir", "last_subs_dir",
+                        "last_subs_output_dir", "last_plex_json_dir", "last_queue_add_dir"]:
+                 current_state_to_save[key] = self.config_manager.config.get(key, DEFAULT_CONFIG.get(key, _HOME))
 
             # Note: self.config_manager.config might have been self._app_config.
             # Using self.config_manager.config as it's used in load_config for updates.
@@ -115,6 +121,10 @@ class CleanVidGUIApp(TkinterDnD.Tk): # Inherit from TkinterDnD.Tk instead of ctk
             # Update the live config with the current UI states before saving
             self.config_manager.config.update(current_state_to_save)
 
+            # Hide the window first: the final write (fsync included) then happens after the window is
+            # already gone, instead of in a window that has stopped responding
+            self.withdraw()
+
             # Save the entire updated live config
             self.config_manager.save_config(self.config_manager.config) # Save the live, updated config
             print("Configuration saved.")
@@ -126,31 +136,6 @@ class CleanVidGUIApp(TkinterDnD.Tk): # Inherit from TkinterDnD.Tk instead of ctk
         self.destroy()
 
 
-    def process_output_queue(self):
-        """
-        Periodically checks the output queue for messages from subprocess threads
-        and appends them to the output console in the action frame.
-        """
-        try:
-            while True:
-                # Get messages from the queue without blocking
-                line = self.output_queue.get_nowait()
-                # Append the line to the output console in the action frame
-                if hasattr(self, 'main_frame') and hasattr(self.main_frame, 'action_output_frame'):
-                    self.main_frame.action_output_frame.log_output(line)
-                else:
-                    # Fallback print if action frame is not available
-                    print(f"GUI Output: {line}", end='')
-        except queue.Empty:
-            pass # No items in the queue
-        except Exception as e:
-            # Log errors related to processing the queue itself
-            print(f"Error processing output queue: {e}")
-        finally:
-            # Reschedule the check after a short delay
-            self.after(100, self.process_output_queue)
-
-
 # --- Main Execution ---
 if __name__ == "__main__":
     # Add the src directory to the Python path so modules can be imported
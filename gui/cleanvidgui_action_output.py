@@ -16,27 +16,48 @@ import json
 from .cleanvidgui_tooltip import Tooltip
 from .cleanvidgui_config import ConfigManager # Import ConfigManager for default paths if needed
 from .cleanvidgui_preview import PreviewWindow
+from .cleanvidgui_signals import ContextBound, context_reference
+from . import cleanvidgui_media_info as media_info
+
+# swears.txt ships alongside cleanvid.py, one level above the gui package
+DEFAULT_SWEARS_PATH = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'swears.txt')) # Built once
+
+def _find_default_swears():
+    """Returns the bundled swears file path if it exists (checked on every call), else None."""
+    return DEFAULT_SWEARS_PATH if os.path.isfile(DEFAULT_SWEARS_PATH) else None
 
 # Need references to other frames to get input values and options
 # from .cleanvidgui_input_output import InputOutputFrame # Imported via type hinting or passed reference
 # from .cleanvidgui_options import OptionsFrame # Imported via type hinting or passed reference
 
-class ActionOutputFrame(ctk.CTkFrame):
+class ActionOutputFrame(ContextBound, ctk.CTkFrame):
     """
     Frame containing the Clean Video button, output console, and copy button.
     Manages subprocess execution and output display.
     """
-    def __init__(self, master, config_manager, output_queue):
+    # Sibling frames, resolved through the shared context unless assigned explicitly
+    input_output_frame = context_reference("io")
+    options_frame = context_reference("options")
+    queue_frame = context_reference("queue")
+
+    def __init__(self, master, config_manager, output_queue, signal_bus=None):
         super().__init__(master)
         self.config_manager = config_manager
         self.output_queue = output_queue
+        self.signal_bus = signal_bus
 
-        # References to other frames (set by the main frame after instantiation)
+        # References to other frames (looked up on the shared context; may also be assigned directly)
         self.input_output_frame = None
         self.options_frame = None
-        self.queue_frame = None # Will be set by MainFrame
+        self.queue_frame = None
+        if signal_bus:
+            signal_bus.on("queue.updated", self.update_clean_button_state)
+            signal_bus.on("queue.opened", self.update_clean_button_state) # Queue panel is built lazily
+            signal_bus.on("options.list_streams", self.list_audio_streams_and_output)
+            signal_bus.on("input.changed", self._prefetch_media_info) # So List Streams is instant later
 
         self.is_processing_queue = False
+        self._file_checks = {} # path -> isfile() result for settings files, reset at the start of each run
         self.is_paused = False # For pause/resume state
         self.pause_requested = False # To signal a desire to pause
         self.process = None
@@ -93,16 +114,21 @@ class ActionOutputFrame(ctk.CTkFrame):
     def process_output_queue(self):
         """Checks the queue for messages from subprocess threads and appends them to the console."""
         try:
-            while True:
-                # Get messages from the queue without blocking
-                line = self.output_queue.get_nowait()
-                # Append the message to the textbox on the main thread
+            if self.ctx is not None:
+                lines = self.ctx.main.drain_output() # Batched, without blocking
+            else: # Standalone use without a main frame
+                lines = []
+                try:
+                    while True:
+                        lines.append(self.output_queue.get_nowait())
+                except queue.Empty:
+                    pass
+            if lines:
+                # Append the whole batch to the textbox in one insert on the main thread
                 self.output_console.configure(state="normal")
-                self.output_console.insert(tk.END, line)
+                self.output_console.insert(tk.END, "".join(lines))
                 self.output_console.see(tk.END) # Scroll to the end
                 self.output_console.configure(state="disabled")
-        except queue.Empty:
-            pass # No items in the queue
         except Exception as e:
             # Log errors related to processing the queue itself
             print(f"Error processing output queue: {e}")
@@ -157,6 +183,7 @@ class ActionOutputFrame(ctk.CTkFrame):
             self.pause_requested = False
             # self.is_processing_queue will be set to true below or handled by single job logic
 
+        self._file_checks.clear() # Files may have changed since the last run
         if self.queue_frame and self.queue_frame.get_item_count() > 0:
             self.is_processing_queue = True
             self.is_paused = False
@@ -182,26 +209,19 @@ class ActionOutputFrame(ctk.CTkFrame):
                     self.update_clean_button_state()
                     return
 
-                current_settings = self.options_frame.get_state()
+                current_settings = dict(self.options_frame.get_state()) # Modified below
 
                 # Validate swears file for single run (similar to old start_clean_process)
                 # This validation should ideally be part of get_state or a dedicated validation method in OptionsFrame
                 swears_file_path = current_settings.get('swears_file', '')
-                if current_settings.get('enable_swears_file', False) and (not swears_file_path or not os.path.isfile(swears_file_path)):
-                    # Path to the gui directory, then up to src, then to cleanvid/swears.txt
-                    # This assumes a certain directory structure.
-                    # A better way would be to use a path relative to the main script or a config setting.
-                    # For now, constructing path relative to this file's parent's parent.
-                    # __file__ -> action_output.py -> gui -> src -> cleanvid -> swears.txt
-                    # This is fragile. Consider making swears_file path resolution more robust.
-                    project_root = Path(__file__).parent.parent.parent
-                    default_swears = project_root / 'cleanvid' / 'swears.txt'
-                    if os.path.isfile(default_swears):
-                        # self.options_frame.swears_file_var.set(str(default_swears)) # Update UI if OptionsFrame allows
-                        current_settings['swears_file'] = str(default_swears)
+                if current_settings.get('enable_swears_file', False) and (not swears_file_path or not self._settings_file_exists(swears_file_path)):
+                    default_swears = _find_default_swears()
+                    if default_swears:
+                        # self.options_frame.swears_file_var.set(default_swears) # Update UI if OptionsFrame allows
+                        current_settings['swears_file'] = default_swears
                         self.log_output(f"Using default swears file for single job: {default_swears}\n")
                     else:
-                        messagebox.showerror("Error", f"Swears file not found for single job.\nDefault not found: {default_swears}")
+                        messagebox.showerror("Error", f"Swears file not found for single job.\nDefault not found: {DEFAULT_SWEARS_PATH}")
                         self.log_output(f"Error: Swears file not found for single job or default not found.\n")
                         self.update_clean_button_state()
                         return
@@ -274,6 +294,11 @@ class ActionOutputFrame(ctk.CTkFrame):
         settings_dict = item_to_process['settings']
         item_id = item_to_process['id']
 
+        if not os.path.isfile(file_path): # Moved or deleted since it was queued: skip instead of failing in cleanvid
+            self.log_output(f"--- Skipping {os.path.basename(file_path)} (ID: {item_id}): file not found ---\n")
+            self.after(0, self.process_next_queue_item)
+            return
+
         self.log_output(f"--- Starting processing for: {os.path.basename(file_path)} (ID: {item_id}) ---\n")
         if self.queue_frame:
             self.queue_frame.update_item_status(item_id, "Processing...")
@@ -291,6 +316,16 @@ class ActionOutputFrame(ctk.CTkFrame):
         self._execute_cleanvid_task(file_path, output_path_suggestion, settings_dict, item_id, is_single_job=False)
 
 
+    def _settings_file_exists(self, path):
+        """
+        isfile() for files named in the settings (swears file, input subs). Queue items usually share
+        these, so each path is checked once per run instead of once per item.
+        """
+        exists = self._file_checks.get(path)
+        if exists is None:
+            exists = self._file_checks[path] = os.path.isfile(path)
+        return exists
+
     def _execute_cleanvid_task(self, input_video_path, output_path_suggestion, settings_dict, item_id, is_single_job=False):
         """Constructs and executes the cleanvid command for a given item."""
         # Determine script path relative to this file
@@ -312,7 +347,7 @@ class ActionOutputFrame(ctk.CTkFrame):
         cmd.extend(["-i", input_video_path])
 
         # Apply settings from settings_dict
-        if settings_dict.get('input_subs') and os.path.isfile(settings_dict['input_subs']):
+        if settings_dict.get('input_subs') and self._settings_file_exists(settings_dict['input_subs']):
             cmd.extend(["-s", settings_dict['input_subs']])
 
         final_output_path_for_checking = output_path_suggestion
@@ -333,7 +368,7 @@ class ActionOutputFrame(ctk.CTkFrame):
         # Boolean flags and optional args from settings_dict
         if settings_dict.get('win_mode'): cmd.append("--win")
         if settings_dict.get('alass_mode'): cmd.append("--alass")
-        if settings_dict.get('enable_swears_file', False) and settings_dict.get('swears_file') and os.path.isfile(settings_dict.get('swears_file')):
+        if settings_dict.get('enable_swears_file', False) and settings_dict.get('swears_file') and self._settings_file_exists(settings_dict.get('swears_file')):
              cmd.extend(["-w", settings_dict['swears_file']])
         if settings_dict.get('enable_subtitle_lang', False) and settings_dict.get('subtitle_lang'):
              cmd.extend(["-l", settings_dict['subtitle_lang']])
@@ -529,7 +564,7 @@ class ActionOutputFrame(ctk.CTkFrame):
         self.log_output(f"Applying preview changes. Excluded indices: {', '.join(excluded_indices) if excluded_indices else 'None'}\n")
         
         input_video = self.input_output_frame.input_video_var.get()
-        current_settings = self.options_frame.get_state().copy()
+        current_settings = dict(self.options_frame.get_state())
         
         if excluded_indices:
             current_settings['exclude_indices'] = ",".join(excluded_indices)
@@ -606,9 +641,9 @@ class ActionOutputFrame(ctk.CTkFrame):
             self.process = None
             self.stop_thread.clear()
 
-            if self.queue_frame: # Optional status update
+            if self.queue_frame: # Final status; the item's row is removed on the main thread
                  status = "Completed" if return_code == 0 else "Failed"
-                 self.queue_frame.update_item_status(item_id, status)
+                 self.after(0, self.queue_frame.finish_item, item_id, status)
 
             if is_single_job:
                 self.after(0, self.on_queue_finished)
@@ -620,6 +655,11 @@ class ActionOutputFrame(ctk.CTkFrame):
     #     """Callback executed on the main thread after the subprocess finishes."""
     #     self.update_clean_button_state() # Use new method
 
+    def _prefetch_media_info(self, input_video_path, *args):
+        """Probes a newly selected input video in the background."""
+        if input_video_path and os.path.isfile(input_video_path):
+            media_info.prefetch((input_video_path,))
+
     def list_audio_streams_and_output(self, input_video_path):
         """Runs cleanvid with --audio-stream-list and outputs to the console."""
         # This method should also use update_clean_button_state before/after if it disables the main button
@@ -628,6 +668,13 @@ class ActionOutputFrame(ctk.CTkFrame):
             self.log_output("Error: No valid input video file selected to list streams.\n")
             return
 
+        # Already probed in the background (input selected or queued) and unchanged since: no subprocess needed
+        cached_streams = media_info.cached_audio_streams(input_video_path)
+        if cached_streams is not None:
+            self.log_output(f"Audio streams for {os.path.basename(input_video_path)}:\n"
+                            f"{media_info.format_audio_streams(cached_streams)}\n------\n")
+            return
+
         script_dir = Path(__file__).parent.parent # Go up from gui to cleanvid dir
         python_exe = sys.executable
         # Always use cleanvid.py for listing, not cleanvidwin.py
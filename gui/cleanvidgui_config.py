@@ -1,24 +1,57 @@
 import json
 import os
 import sys
+import hashlib
+import types
 from pathlib import Path
+try:
+    import orjson # Optional, much faster (de)serialization when installed
+except ImportError:
+    orjson = None
 
 # --- Constants ---
 CONFIG_FILE_NAME = "cleanvid_gui_config.json"
-DEFAULT_CONFIG = {
+_HOME = str(Path.home()) # Resolved once at import
+_SWEARS_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), '..')) # swears.txt lives next to cleanvid.py
+# Video extensions accepted by the input field and the queue (lowercase, with dot; dialog filter order)
+VIDEO_EXT_ORDER = (".mp4", ".mkv", ".avi", ".mov", ".webm", ".flv", ".wmv")
+VIDEO_EXTS = frozenset(VIDEO_EXT_ORDER)
+DEFAULT_CONFIG = types.MappingProxyType({ # Read-only so it can be shared without defensive copies
     "win_mode": sys.platform.startswith("win"), # Default based on OS
     "alass_mode": False,
     "swears_file": "", # Default swears file relative to gui dir
     "default_media_dir": "",
-    "last_input_dir": str(Path.home()), # Start at home dir initially
-    "last_output_dir": str(Path.home()),
-    "last_swears_dir": os.path.join(os.path.dirname(__file__), '..'), # Default swears dir relative to gui dir
-    "last_subs_dir": str(Path.home()),
+    "last_input_dir": _HOME, # Start at home dir initially
+    "last_output_dir": _HOME,
+    "last_swears_dir": _SWEARS_DIR, # Default swears dir relative to gui dir
+    "last_subs_dir": _HOME,
+    # Per-dialog last directories (see ConfigManager.get_last_dir); empty until first used
+    "last_subs_output_dir": "",
+    "last_plex_json_dir": "",
+    "last_queue_add_dir": "",
     "window_geometry": "1250x750", # Default window size - Increased width
     "chapter_markers": False,
     "fast_index": False, # Add this
     "pending_queue": [], # For persisting the queue items
-}
+    "pending_queue_counter": None, # item_id_counter saved with the queue, so reloading need not scan the ids
+    "show_queue_panel": True, # Set False to never build the queue panel
+})
+
+def json_dumps(obj):
+    """Serializes obj to pretty-printed UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, indent=2, sort_keys=True).encode('utf-8')
+
+def json_loads(data):
+    """Parses JSON from bytes or str, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _digest(data):
+    """Short fingerprint of serialized config bytes, used to skip no-op writes."""
+    return hashlib.blake2b(data, digest_size=16).digest()
 
 class ConfigManager:
     """
@@ -29,40 +62,65 @@ class ConfigManager:
         script_dir = Path(__file__).parent
         self.config_path = script_dir / CONFIG_FILE_NAME
         self.config = {} # Initialize config dictionary
+        self._last_dirs = {} # Dialog kind -> directory picked this session (see flush_last_dirs)
+        self._last_hash = None # Digest of the bytes last read from / written to disk
 
     def load_config(self):
         """Loads configuration from the JSON file, merging with defaults."""
-        if self.config_path.exists():
-            try:
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    loaded_config = json.load(f)
-                    # Start with defaults and update with loaded values
-                    self.config = DEFAULT_CONFIG.copy()
-                    self.config.update(loaded_config)
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Error loading config file '{self.config_path}': {e}. Using defaults.")
-                self.config = DEFAULT_CONFIG.copy()
-        else:
+        try:
+            with open(self.config_path, 'rb') as f:
+                raw = f.read()
+            loaded_config = json_loads(raw)
+            self._last_hash = _digest(raw) # Saving the same content back is then a no-op
+            # Defaults first, loaded values override; missing keys keep their defaults
+            self.config = {**DEFAULT_CONFIG, **loaded_config}
+        except FileNotFoundError:
             print(f"Config file not found at '{self.config_path}'. Using defaults.")
-            self.config = DEFAULT_CONFIG.copy()
+            self.config = dict(DEFAULT_CONFIG)
+        except (ValueError, IOError) as e: # orjson.JSONDecodeError and json.JSONDecodeError are both ValueErrors
+            print(f"Error loading config file '{self.config_path}': {e}. Using defaults.")
+            self.config = dict(DEFAULT_CONFIG)
+        return self.config
 
-        # Ensure all default keys are present in case the loaded file was incomplete
-        for key, default_value in DEFAULT_CONFIG.items():
-            if key not in self.config:
-                self.config[key] = default_value
+    def get_last_dir(self, kind):
+        """Returns the directory last used by the given dialog kind, or None if unset or no longer valid."""
+        key = f"last_{kind}_dir"
+        directory = self._last_dirs.get(kind) or self.config.get(key, DEFAULT_CONFIG.get(key))
+        return directory if directory and os.path.isdir(directory) else None
 
-        return self.config
+    def set_last_dir(self, kind, directory):
+        """Remembers the directory last used by the given dialog kind for the session; see flush_last_dirs()."""
+        if directory:
+            self._last_dirs[kind] = directory
 
-    def save_config(self, current_config_state):
-        """Saves the current configuration state to the JSON file."""
+    def flush_last_dirs(self):
+        """Merges the directories remembered this session into the live config (saved with it on close)."""
+        for kind, directory in self._last_dirs.items():
+            self.config[f"last_{kind}_dir"] = directory
+
+    def save_config(self, state):
+        """Saves the given configuration state to the JSON file, skipping the write if nothing changed."""
         # Use the provided state, don't rely on self.config directly
         # This allows the main app to manage the live state
+        try:
+            serialized = json_dumps(state) # Serialize once, write in a single call
+        except (TypeError, ValueError) as e:
+            print(f"Error serializing config for '{self.config_path}': {e}")
+            return
+        digest = _digest(serialized)
+        if digest == self._last_hash:
+            return # Identical to what is already on disk
         try:
             # Ensure the directory exists before writing
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(current_config_state, f, indent=4)
-        except IOError as e:
+            # Write to a sibling temp file and swap it in, so a crash mid-write never leaves a truncated config
+            tmp_path = self.config_path.with_suffix(self.config_path.suffix + ".tmp")
+            with open(tmp_path, 'wb', buffering=0) as f:
+                f.write(serialized)
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.config_path)
+            self._last_hash = digest
+        except OSError as e:
             print(f"Error saving config file '{self.config_path}': {e}")
 
 # Example Usage (for testing purposes, can be removed later)
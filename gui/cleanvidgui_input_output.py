@@ -1,20 +1,65 @@
 import customtkinter as ctk
 import tkinter as tk
-from tkinter import filedialog, messagebox
 import os
+import stat
+import time
+from functools import partial
 from pathlib import Path
 
-from .cleanvidgui_tooltip import Tooltip
-from .cleanvidgui_config import DEFAULT_CONFIG # Import DEFAULT_CONFIG for initial values
-
-class InputOutputFrame(ctk.CTkFrame):
+from .cleanvidgui_tooltip import lazy_tooltip
+from .cleanvidgui_config import DEFAULT_CONFIG, _HOME, VIDEO_EXT_ORDER, VIDEO_EXTS # Import DEFAULT_CONFIG for initial values
+from .cleanvidgui_signals import ContextBound, context_reference
+
+# Recognised drop/browse extensions (lowercase, with dot); video ones are shared with the queue
+SUB_EXTS = frozenset({".srt"})
+VIDEO_FILETYPES = (("Video Files", " ".join("*" + ext for ext in VIDEO_EXT_ORDER)), ("All Files", "*.*"))
+SUBS_FILETYPES = (("SRT Subtitles", " ".join("*" + ext for ext in sorted(SUB_EXTS))), ("All Files", "*.*"))
+
+# Warning shown when a drop target receives the wrong kind of file
+_DROP_REJECT_MESSAGES = {
+    "video": "Please drop a valid video file.",
+    "subs": "Please drop a valid .srt subtitle file.",
+    "frame": "Unsupported file type dropped.",
+}
+
+# Short-lived cache of directory checks; repeated browse clicks on slow (e.g. network) drives skip the stat
+_isdir_cache = {} # path -> (checked_at, is_dir)
+
+def _isdir_cached(path, ttl=2.0):
+    """Directory check with results remembered for ttl seconds."""
+    now = time.monotonic()
+    hit = _isdir_cache.get(path)
+    if hit and now - hit[0] < ttl:
+        return hit[1]
+    is_dir = _stat_isdir(path)
+    _isdir_cache[path] = (now, is_dir)
+    return is_dir
+
+def _stat_mode(path):
+    """Returns the st_mode of path, or None if it cannot be stat'ed."""
+    try:
+        return os.stat(path).st_mode
+    except (OSError, ValueError):
+        return None
+
+def _stat_isdir(path):
+    """Single-stat directory check."""
+    mode = _stat_mode(path)
+    return mode is not None and stat.S_ISDIR(mode)
+
+class InputOutputFrame(ContextBound, ctk.CTkFrame):
     """
     Frame for handling input video, subtitle, and output path selection.
     Includes browse buttons, drag-and-drop support, and output path logic.
     """
-    def __init__(self, master, config_manager, options_frame=None, action_output_frame=None):
+    # Sibling frames, resolved through the shared context unless passed in explicitly
+    options_frame = context_reference("options")
+    action_output_frame = context_reference("action")
+
+    def __init__(self, master, config_manager, options_frame=None, action_output_frame=None, signal_bus=None):
         super().__init__(master)
         self.config_manager = config_manager
+        self.signal_bus = signal_bus
         self.options_frame = options_frame # Reference to the options frame for live settings
         self.action_output_frame = action_output_frame # Reference to the action/output frame for logging/updates
 
@@ -32,85 +77,123 @@ class InputOutputFrame(ctk.CTkFrame):
         self.save_to_same_dir_var = ctk.BooleanVar(value=self.config_manager.config.get("save_to_same_dir", True))
 
         # --- UI Elements ---
+        # Widget constructors and common grid padding bound once for the build below
+        Label, Entry, Button = ctk.CTkLabel, ctk.CTkEntry, ctk.CTkButton
+        pad = {"padx": 5, "pady": 5}
+
         # Video Input
-        ctk.CTkLabel(self, text="Source Video:").grid(row=0, column=0, padx=5, pady=5, sticky="w")
-        self.video_entry = ctk.CTkEntry(self, textvariable=self.input_video_var, state="readonly")
-        self.video_entry.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
-        browse_video_btn = ctk.CTkButton(self, text="Browse...", command=self.browse_video)
-        browse_video_btn.grid(row=0, column=2, padx=5, pady=5)
-        Tooltip(browse_video_btn, "Select the video file to clean.")
-        Tooltip(self.video_entry, "Path to the source video file.") # Tooltip for entry
+        Label(self, text="Source Video:").grid(row=0, column=0, sticky="w", **pad)
+        self.video_entry = Entry(self, textvariable=self.input_video_var, state="readonly")
+        self.video_entry.grid(row=0, column=1, sticky="ew", **pad)
+        browse_video_btn = Button(self, text="Browse...", command=self.browse_video)
+        browse_video_btn.grid(row=0, column=2, **pad)
 
         # Subtitle Input
-        ctk.CTkLabel(self, text="Subtitles (.srt):").grid(row=1, column=0, padx=5, pady=5, sticky="w")
-        self.subs_entry = ctk.CTkEntry(self, textvariable=self.input_subs_var, state="readonly")
-        self.subs_entry.grid(row=1, column=1, padx=5, pady=5, sticky="ew")
-        browse_subs_btn = ctk.CTkButton(self, text="Browse...", command=self.browse_subs)
-        browse_subs_btn.grid(row=1, column=2, padx=5, pady=5)
-        Tooltip(browse_subs_btn, "Select the subtitle file.\nIf empty, cleanvid will attempt to use\nembedded subtitles or download them.")
-        Tooltip(self.subs_entry, "Path to the .srt subtitle file (optional).") # Tooltip for entry
+        Label(self, text="Subtitles (.srt):").grid(row=1, column=0, sticky="w", **pad)
+        self.subs_entry = Entry(self, textvariable=self.input_subs_var, state="readonly")
+        self.subs_entry.grid(row=1, column=1, sticky="ew", **pad)
+        browse_subs_btn = Button(self, text="Browse...", command=self.browse_subs)
+        browse_subs_btn.grid(row=1, column=2, **pad)
 
         # Output Options Checkbox
-        self.output_checkbox = ctk.CTkCheckBox(self, text="Save output to same directory with `_clean` suffix", variable=self.save_to_same_dir_var)
-        self.output_checkbox.grid(row=2, column=0, columnspan=3, padx=5, pady=5, sticky="w")
-        Tooltip(self.output_checkbox, "Check to automatically save the cleaned video in the same folder\nas the input, adding '_clean' to the filename.\nUncheck to specify a different output location and filename.")
+        self.output_checkbox = ctk.CTkCheckBox(self, text="Save output to same directory with `_clean` suffix", variable=self.save_to_same_dir_var,
+                                               command=self.update_output_path_frame) # Toggles the output path frame visibility
+        self.output_checkbox.grid(row=2, column=0, columnspan=3, sticky="w", **pad)
 
         # Conditional Output Path Frame
         self.output_path_frame = ctk.CTkFrame(self)
-        # Grid placement is handled by update_output_path_frame
+        # Gridded once here; update_output_path_frame only removes/restores it
+        self.output_path_frame.grid(row=3, column=0, columnspan=3, **pad, sticky="ew")
         self.output_path_frame.grid_columnconfigure(1, weight=1)
 
-        ctk.CTkLabel(self.output_path_frame, text="Output Directory:").grid(row=0, column=0, padx=5, pady=5, sticky="w")
-        self.output_dir_entry = ctk.CTkEntry(self.output_path_frame, textvariable=self.output_dir_var, state="readonly")
-        self.output_dir_entry.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
-        ctk.CTkButton(self.output_path_frame, text="Browse...", command=self.browse_output_dir).grid(row=0, column=2, padx=5, pady=5)
-        Tooltip(self.output_dir_entry, "Directory where the cleaned video will be saved.") # Tooltip for entry
-
-        ctk.CTkLabel(self.output_path_frame, text="Output Filename:").grid(row=1, column=0, padx=5, pady=5, sticky="w")
-        self.output_filename_entry = ctk.CTkEntry(self.output_path_frame, textvariable=self.output_filename_var)
-        self.output_filename_entry.grid(row=1, column=1, columnspan=2, padx=5, pady=5, sticky="ew")
-        Tooltip(self.output_filename_entry, "Filename for the cleaned video.") # Tooltip for entry
-
+        Label(self.output_path_frame, text="Output Directory:").grid(row=0, column=0, sticky="w", **pad)
+        self.output_dir_entry = Entry(self.output_path_frame, textvariable=self.output_dir_var, state="readonly")
+        self.output_dir_entry.grid(row=0, column=1, sticky="ew", **pad)
+        Button(self.output_path_frame, text="Browse...", command=self.browse_output_dir).grid(row=0, column=2, **pad)
+
+        Label(self.output_path_frame, text="Output Filename:").grid(row=1, column=0, sticky="w", **pad)
+        self.output_filename_entry = Entry(self.output_path_frame, textvariable=self.output_filename_var)
+        self.output_filename_entry.grid(row=1, column=1, columnspan=2, sticky="ew", **pad)
+
+        # Tooltips are only built when first hovered
+        self._register_tooltips({
+            browse_video_btn: "Select the video file to clean.",
+            self.video_entry: "Path to the source video file.",
+            browse_subs_btn: "Select the subtitle file.\nIf empty, cleanvid will attempt to use\nembedded subtitles or download them.",
+            self.subs_entry: "Path to the .srt subtitle file (optional).",
+            self.output_checkbox: "Check to automatically save the cleaned video in the same folder\nas the input, adding '_clean' to the filename.\nUncheck to specify a different output location and filename.",
+            self.output_dir_entry: "Directory where the cleaned video will be saved.",
+            self.output_filename_entry: "Filename for the cleaned video.",
+        })
 
         # --- Bindings ---
-        # Trace the checkbox variable to update the output path frame visibility
-        self.save_to_same_dir_var.trace_add("write", self.update_output_path_frame)
+        # Path edits are coalesced into one debounced signal each; "input.changed" only fires for the
+        # input video (its listeners, e.g. the media info prefetch, don't care about the output dir)
+        self.input_video_var.trace_add("write", self._on_input_changed)
+        self.output_dir_var.trace_add("write", self._on_output_dir_changed)
+        if signal_bus:
+            signal_bus.on("input.changed", self.auto_set_output_filename)
+            signal_bus.on("output_dir.changed", self.auto_set_output_filename)
 
         # --- Drag and Drop Bindings ---
+        # Dropped file extension -> handler, and the handler each dedicated entry insists on
+        self._drop_handlers = {**{ext: self._accept_video for ext in VIDEO_EXTS},
+                               **{ext: self._accept_subs for ext in SUB_EXTS}}
+        self._drop_target_handlers = {"video": self._accept_video, "subs": self._accept_subs}
+
         # Bind drag and drop events to the entry widgets
-        self.video_entry.bind("<ButtonPress-1>", lambda e: self.start_drag(e, "video"))
-        self.video_entry.bind("<B1-Motion>", lambda e: self.do_drag(e, "video"))
-        self.video_entry.bind("<ButtonRelease-1>", lambda e: self.stop_drag(e, "video"))
+        self.video_entry.bind("<ButtonPress-1>", partial(self.start_drag, field_type="video"))
+        self.video_entry.bind("<B1-Motion>", partial(self.do_drag, field_type="video"))
+        self.video_entry.bind("<ButtonRelease-1>", partial(self.stop_drag, field_type="video"))
 
-        self.subs_entry.bind("<ButtonPress-1>", lambda e: self.start_drag(e, "subs"))
-        self.subs_entry.bind("<B1-Motion>", lambda e: self.do_drag(e, "subs"))
-        self.subs_entry.bind("<ButtonRelease-1>", lambda e: self.stop_drag(e, "subs"))
+        self.subs_entry.bind("<ButtonPress-1>", partial(self.start_drag, field_type="subs"))
+        self.subs_entry.bind("<B1-Motion>", partial(self.do_drag, field_type="subs"))
+        self.subs_entry.bind("<ButtonRelease-1>", partial(self.stop_drag, field_type="subs"))
 
         # Bind drop events to the entry widgets and the frame itself
         # Register drop targets and bind using tkinterdnd2
         self.video_entry.drop_target_register('DND_Files')
-        self.video_entry.dnd_bind('<<Drop>>', lambda e: self.drop(e, "video"))
+        self.video_entry.dnd_bind('<<Drop>>', partial(self.drop, target_type="video"))
 
         self.subs_entry.drop_target_register('DND_Files')
-        self.subs_entry.dnd_bind('<<Drop>>', lambda e: self.drop(e, "subs"))
+        self.subs_entry.dnd_bind('<<Drop>>', partial(self.drop, target_type="subs"))
 
         self.drop_target_register('DND_Files') # Register the frame itself
-        self.dnd_bind('<<Drop>>', lambda e: self.drop(e, "frame")) # Allow dropping anywhere on the frame
+        self.dnd_bind('<<Drop>>', partial(self.drop, target_type="frame")) # Allow dropping anywhere on the frame
 
         # --- Initial State ---
         self.update_output_path_frame() # Set initial visibility of output path frame
 
 
+    def _register_tooltips(self, tooltips):
+        """Registers tooltip texts for several widgets at once; each Tooltip is built on first hover."""
+        for widget, text in tooltips.items():
+            lazy_tooltip(widget, text)
+
     def update_output_path_frame(self, *args):
         """Shows or hides the custom output path frame based on the checkbox state."""
         if self.save_to_same_dir_var.get():
-            self.output_path_frame.grid_forget() # Hide the frame
+            self.output_path_frame.grid_remove() # Hide the frame, keeping its grid options
         else:
-            # Show the frame below the checkbox
-            self.output_path_frame.grid(row=3, column=0, columnspan=3, padx=5, pady=5, sticky="ew")
+            # Show the frame below the checkbox at its remembered grid position
+            self.output_path_frame.grid()
             # Attempt to auto-set filename if input video exists and output directory is set
             self.auto_set_output_filename()
 
+    def _on_input_changed(self, *args):
+        """Trace callback for the input video variable."""
+        if self.signal_bus:
+            self.signal_bus.emit_debounced("input.changed", self.input_video_var.get(), delay_ms=100)
+        else:
+            self.auto_set_output_filename()
+
+    def _on_output_dir_changed(self, *args):
+        """Trace callback for the output directory variable."""
+        if self.signal_bus:
+            self.signal_bus.emit_debounced("output_dir.changed", self.output_dir_var.get(), delay_ms=100)
+        else:
+            self.auto_set_output_filename()
+
     def get_initial_dir(self, dir_type):
         """Gets the initial directory for file dialogs based on config and live settings."""
         # Prioritize live default_media_dir from OptionsFrame if available
@@ -119,48 +202,46 @@ class InputOutputFrame(ctk.CTkFrame):
             default_dir = self.options_frame.default_media_dir_var.get()
 
         # Use default media dir if set and valid for relevant types
-        if default_dir and os.path.isdir(default_dir) and dir_type in ["video", "subs", "output"]:
+        if default_dir and _isdir_cached(default_dir) and dir_type in ["video", "subs", "output"]:
              return default_dir
-        # Fallback to last used directory for that specific type
-        last_dir_key = f"last_{dir_type}_dir"
-        # Use .get() with a default from DEFAULT_CONFIG to handle missing keys gracefully
-        last_dir = self.config_manager.config.get(last_dir_key, DEFAULT_CONFIG.get(last_dir_key, str(Path.home())))
-        # Final fallback to home if last_dir is invalid
-        return last_dir if os.path.isdir(last_dir) else str(Path.home())
+        # Fallback to last used directory for that specific type, then to home if it is invalid
+        return self.config_manager.get_last_dir(dir_type) or _HOME
 
     def update_last_dir(self, dir_type, selected_path):
-        """Updates the last used directory in the config for the session."""
+        """Remembers the last used directory for the session (see ConfigManager.set_last_dir)."""
         if selected_path:
-            # Get directory from file path or use directory path directly
-            directory = os.path.dirname(selected_path) if os.path.isfile(selected_path) else selected_path
-            if os.path.isdir(directory):
-                last_dir_key = f"last_{dir_type}_dir"
-                self.config_manager.config[last_dir_key] = directory # Update the live config dict
+            # One stat tells us both whether the path is a file and whether it is a directory
+            mode = _stat_mode(selected_path)
+            if mode is None:
+                return
+            if stat.S_ISREG(mode):
+                self.config_manager.set_last_dir(dir_type, os.path.dirname(selected_path)) # A file's parent is a directory
+            elif stat.S_ISDIR(mode):
+                self.config_manager.set_last_dir(dir_type, selected_path)
 
     def browse_video(self):
         """Opens a file dialog to select the input video file."""
+        from tkinter import filedialog # Imported on first use to keep module import light
         initial_dir = self.get_initial_dir("video")
         filepath = filedialog.askopenfilename(
             title="Select Video File",
             initialdir=initial_dir,
-            filetypes=(("Video Files", "*.mp4 *.mkv *.avi *.mov *.wmv"), ("All Files", "*.*"))
+            filetypes=VIDEO_FILETYPES
         )
         if filepath:
-            self.input_video_var.set(filepath)
+            self.input_video_var.set(filepath) # Output filename follows through the variable trace
             self.update_last_dir("video", filepath)
-            # Auto-populate output filename if custom path is used
-            if not self.save_to_same_dir_var.get():
-                 self.auto_set_output_filename()
             self.log_to_console(f"Selected video: {filepath}\n")
 
 
     def browse_subs(self):
         """Opens a file dialog to select the input subtitle file."""
+        from tkinter import filedialog # Imported on first use to keep module import light
         initial_dir = self.get_initial_dir("subs")
         filepath = filedialog.askopenfilename(
             title="Select Subtitle File",
             initialdir=initial_dir,
-            filetypes=(("SRT Subtitles", "*.srt"), ("All Files", "*.*"))
+            filetypes=SUBS_FILETYPES
         )
         if filepath:
             self.input_subs_var.set(filepath)
@@ -170,21 +251,21 @@ class InputOutputFrame(ctk.CTkFrame):
 
     def browse_output_dir(self):
         """Opens a directory dialog to select the output directory."""
+        from tkinter import filedialog # Imported on first use to keep module import light
         initial_dir = self.get_initial_dir("output")
         dirpath = filedialog.askdirectory(
             title="Select Output Directory",
             initialdir=initial_dir
         )
         if dirpath:
-            self.output_dir_var.set(dirpath)
+            self.output_dir_var.set(dirpath) # Output filename follows through the variable trace
             self.update_last_dir("output", dirpath)
-            # Auto-populate output filename if not already set
-            self.auto_set_output_filename() # Call even if filename exists, might base on new dir
             self.log_to_console(f"Selected output directory: {dirpath}\n")
 
 
     def browse_subs_output(self):
         """Opens a save file dialog for the clean subtitle output file."""
+        from tkinter import filedialog # Imported on first use to keep module import light
         initial_dir = self.get_initial_dir("output") # Use output dir logic
         # Suggest filename based on input video if possible
         suggested_name = ""
@@ -206,6 +287,7 @@ class InputOutputFrame(ctk.CTkFrame):
 
     def browse_plex_json(self):
         """Opens a save file dialog for the PlexAutoSkip JSON file."""
+        from tkinter import filedialog # Imported on first use to keep module import light
         initial_dir = self.get_initial_dir("output") # Use output dir logic
         # Suggest filename based on input video if possible
         suggested_name = ""
@@ -225,19 +307,21 @@ class InputOutputFrame(ctk.CTkFrame):
             self.log_to_console(f"Selected PlexAutoSkip JSON output: {filepath}\n")
 
 
-    def auto_set_output_filename(self):
+    def auto_set_output_filename(self, *args):
         """Sets the default output filename based on input video and output directory."""
-        input_video = self.input_video_var.get()
-        output_dir = self.output_dir_var.get()
         # Only set if custom output is chosen, input video is selected, and output directory is set
-        if input_video and output_dir and not self.save_to_same_dir_var.get():
-            in_path = Path(input_video)
-            out_filename = f"{in_path.stem}_clean{in_path.suffix}"
-            # Only set the filename if the current filename is empty or matches the default pattern
-            # This prevents overwriting a filename the user manually entered
-            current_filename = self.output_filename_var.get()
-            if not current_filename or current_filename == f"{Path(current_filename).stem}{Path(current_filename).suffix}":
-                 self.output_filename_var.set(out_filename)
+        if self.save_to_same_dir_var.get():
+            return
+        input_video = self.input_video_var.get()
+        if not input_video or not self.output_dir_var.get():
+            return
+        in_path = Path(input_video)
+        out_filename = f"{in_path.stem}_clean{in_path.suffix}"
+        # Only set the filename if the current filename is empty or matches the default pattern
+        # This prevents overwriting a filename the user manually entered
+        current_filename = self.output_filename_var.get()
+        if not current_filename or current_filename == f"{Path(current_filename).stem}{Path(current_filename).suffix}":
+             self.output_filename_var.set(out_filename)
 
 
     # --- Drag and Drop Implementation ---
@@ -265,6 +349,7 @@ class InputOutputFrame(ctk.CTkFrame):
 
     def drop(self, event, target_type):
         """Handles the drop event using tkinterdnd2."""
+        from tkinter import messagebox # Imported on first use to keep module import light
         # tkinterdnd2 passes the dropped file paths as a stringified Tcl list
         # Use tk.splitlist to correctly parse it, handling spaces in paths
         try:
@@ -287,46 +372,32 @@ class InputOutputFrame(ctk.CTkFrame):
 
         # Ensure the path uses correct OS separators (important on Windows)
         filepath = os.path.normpath(filepath)
+        ext = os.path.splitext(filepath)[1].lower()
+
+        # Pick the handler from the extension; the video/subs entries only accept their own kind
+        handler = self._drop_handlers.get(ext)
+        expected = self._drop_target_handlers.get(target_type)
+        if handler is None or (expected is not None and handler != expected):
+            messagebox.showwarning("Invalid Drop", _DROP_REJECT_MESSAGES.get(target_type, "Unsupported file type dropped."))
+            self.log_to_console(f"Invalid drop (unsupported type): {filepath}\n")
+            return
+        if not os.path.isfile(filepath):
+            messagebox.showwarning("Invalid Drop", "Please drop a valid file.")
+            self.log_to_console(f"Invalid drop (not a file): {filepath}\n")
+            return
+        handler(filepath)
+
+    def _accept_video(self, filepath):
+        """Uses a dropped file as the input video."""
+        self.input_video_var.set(filepath) # Output filename follows through the variable trace
+        self.update_last_dir("video", filepath)
+        self.log_to_console(f"Dropped video: {filepath}\n")
 
-        if target_type == "video":
-            if os.path.isfile(filepath):
-                self.input_video_var.set(filepath)
-                self.update_last_dir("video", filepath)
-                if not self.save_to_same_dir_var.get():
-                     self.auto_set_output_filename()
-                self.log_to_console(f"Dropped video: {filepath}\n")
-            else:
-                 messagebox.showwarning("Invalid Drop", "Please drop a valid video file.")
-                 self.log_to_console(f"Invalid drop (not a file): {filepath}\n")
-
-        elif target_type == "subs":
-            if os.path.isfile(filepath) and filepath.lower().endswith(".srt"):
-                self.input_subs_var.set(filepath)
-                self.update_last_dir("subs", filepath)
-                self.log_to_console(f"Dropped subtitles: {filepath}\n")
-            else:
-                 messagebox.showwarning("Invalid Drop", "Please drop a valid .srt subtitle file.")
-                 self.log_to_console(f"Invalid drop (not a .srt file): {filepath}\n")
-
-        elif target_type == "frame":
-             # If dropped on the frame, try to guess based on extension
-             if os.path.isfile(filepath):
-                 if filepath.lower().endswith((".mp4", ".mkv", ".avi", ".mov", ".wmv")):
-                     self.input_video_var.set(filepath)
-                     self.update_last_dir("video", filepath)
-                     if not self.save_to_same_dir_var.get():
-                          self.auto_set_output_filename()
-                     self.log_to_console(f"Dropped video (on frame): {filepath}\n")
-                 elif filepath.lower().endswith(".srt"):
-                     self.input_subs_var.set(filepath)
-                     self.update_last_dir("subs", filepath)
-                     self.log_to_console(f"Dropped subtitles (on frame): {filepath}\n")
-                 else:
-                     messagebox.showwarning("Invalid Drop", "Unsupported file type dropped.")
-                     self.log_to_console(f"Invalid drop (unsupported type): {filepath}\n")
-             else:
-                 messagebox.showwarning("Invalid Drop", "Please drop a valid file.")
-                 self.log_to_console(f"Invalid drop (not a file): {filepath}\n")
+    def _accept_subs(self, filepath):
+        """Uses a dropped file as the input subtitles."""
+        self.input_subs_var.set(filepath)
+        self.update_last_dir("subs", filepath)
+        self.log_to_console(f"Dropped subtitles: {filepath}\n")
 
 
     def get_state(self):
@@ -337,7 +408,7 @@ class InputOutputFrame(ctk.CTkFrame):
             "save_to_same_dir": self.save_to_same_dir_var.get(),
             "output_dir": self.output_dir_var.get(),
             "output_filename": self.output_filename_var.get(),
-            # last_dirs are updated directly in config_manager.config by browse methods
+            # last_dirs are kept by config_manager and merged into its config on close (flush_last_dirs)
         }
 
     def log_to_console(self, message):
@@ -1,124 +1,257 @@
 import customtkinter as ctk
-import tkinter as tk # Needed for sticky constants like "nsew"
+from tkinter import ttk # PanedWindow between the main content and the queue panel
+import functools
+import importlib
+import queue
+from types import SimpleNamespace
 
-# Import the frame modules (will be implemented next)
-# from .cleanvidgui_input_output import InputOutputFrame
-# from .cleanvidgui_options import OptionsFrame
-# from .cleanvidgui_action_output import ActionOutputFrame
+from .cleanvidgui_config import DEFAULT_CONFIG
+from .cleanvidgui_signals import SignalBus
+
+# Spacing around the sub-frames, in unscaled pixels. CTk's grid() applies the widget scaling
+# itself, so these stay whole multiples of 5 and are never pre-multiplied here.
+PAD = 10
+GAP = 5
+
+# Sub-frame class name -> module it lives in (imported on first use; see _frame_class)
+_FRAME_MODULES = {
+    "InputOutputFrame": ".cleanvidgui_input_output",
+    "OptionsFrame": ".cleanvidgui_options",
+    "ActionOutputFrame": ".cleanvidgui_action_output",
+    "QueueFrame": ".cleanvidgui_queue_frame",
+}
+
+@functools.lru_cache(maxsize=None)
+def _group_by_weight(specs):
+    """Groups ((index, weight), ...) into ((indices, weight), ...) so each weight needs one configure call."""
+    groups = {}
+    for index, weight in specs:
+        groups.setdefault(weight, []).append(index)
+    return tuple((tuple(indices), weight) for weight, indices in groups.items())
+
+def _configure_grid(widget, rows=(), cols=()):
+    """Applies (index, weight) row/column weights to widget's grid with one call per distinct weight."""
+    for indices, weight in _group_by_weight(rows):
+        widget.grid_rowconfigure(indices, weight=weight)
+    for indices, weight in _group_by_weight(cols):
+        widget.grid_columnconfigure(indices, weight=weight)
+
+@functools.lru_cache(maxsize=None)
+def _frame_class(name):
+    """
+    Imports and returns a sub-frame class, once per process.
+    Imports stay lazy (avoiding circular imports and keeping deferred frames off the startup path),
+    but repeat builds skip the import machinery entirely.
+    """
+    return getattr(importlib.import_module(_FRAME_MODULES[name], __package__), name)
 
 class CleanVidMainFrame(ctk.CTkFrame):
     """
     Main frame for the CleanVid GUI.
-    Holds and arranges the Input/Output, Options, and Action/Output frames.
+    Holds and arranges the Input/Output, Options, Action/Output and Queue frames.
     """
     def __init__(self, master, config_manager, output_queue):
-        super().__init__(master)
+        # Pure layout container: no fill, corners or border for CTk to redraw on every resize
+        super().__init__(master, fg_color="transparent", corner_radius=0, border_width=0)
         self.config_manager = config_manager
         self.output_queue = output_queue
+        self.bus = SignalBus(self) # Frames talk to each other through this instead of direct wiring
+        # Shared references handed to every sub-frame via bind_context(); filled in as frames are built
+        self.ctx = SimpleNamespace(main=self, bus=self.bus, io=None, options=None, action=None, queue=None)
 
-        # Configure grid layout for the main frame
-        self.grid_columnconfigure(0, weight=2) # Main content column (input, options, action/output)
-        self.grid_columnconfigure(1, weight=1) # QueueFrame column
-        # Row configurations for column 0:
-        self.grid_rowconfigure(0, weight=0) # Input/Output frame
-        self.grid_rowconfigure(1, weight=0) # Options frame
-        # self.grid_rowconfigure(2, weight=0) # This was for Advanced Options (Tabs) frame, now action_output_frame is on row 2
-        self.grid_rowconfigure(2, weight=1) # Action/Output frame (expands vertically in column 0)
-        # self.grid_rowconfigure(3, weight=1) # This row is no longer explicitly needed as action_output_frame is on row 2
+        # The main content and the queue panel sit side by side in a paned window, so dragging
+        # the sash (or resizing the window) only re-lays out the two panes.
+        _configure_grid(self, rows=((0, 1),), cols=((0, 1),))
+        self.paned = ttk.PanedWindow(self, orient="horizontal")
+        self.paned.grid(row=0, column=0, sticky="nsew")
+        # This frame is sized by its master (fill/expand), never by its content, so child size
+        # changes need not propagate past it
+        self.grid_propagate(False)
 
+        # Left pane: main content column (input, options, action/output)
+        self.left_frame = ctk.CTkFrame(self.paned, fg_color="transparent", corner_radius=0, border_width=0)
+        # Rows: Input/Output and Options frames keep their height, the Action/Output frame expands vertically
+        _configure_grid(self.left_frame, rows=((0, 0), (1, 0), (2, 1)), cols=((0, 1),))
+        self.paned.add(self.left_frame, weight=2)
 
-        # --- Instantiate Sub-Frames ---
-        # Import here to avoid potential circular dependencies during development
-        from .cleanvidgui_input_output import InputOutputFrame
-        from .cleanvidgui_options import OptionsFrame
-        from .cleanvidgui_action_output import ActionOutputFrame
-        from .cleanvidgui_queue_frame import QueueFrame
 
-        # Create the frames
-        # Create OptionsFrame first so it can be passed to InputOutputFrame
-        self.advanced_options_frame = OptionsFrame(self, config_manager=self.config_manager) # OptionsFrame will handle tabs
-        self.input_output_frame = InputOutputFrame(self, config_manager=self.config_manager, options_frame=self.advanced_options_frame)
-        # self.core_options_frame = ctk.CTkFrame(self) # Placeholder removed
-        self.action_output_frame = ActionOutputFrame(self, config_manager=self.config_manager, output_queue=self.output_queue)
+        # --- Instantiate Sub-Frames ---
+        # Only the Input/Output frame is built before the window first paints; the options tabs,
+        # action/output console and queue panel follow on the next idle cycle.
+        self.advanced_options_frame = None
+        self.action_output_frame = None
+        self.queue_frame = None
+        self._queue_placeholder = None
+        self._show_queue = self.config_manager.config.get("show_queue_panel", DEFAULT_CONFIG["show_queue_panel"])
+        self._frames_ready = False
+        self._ready_callbacks = [] # Run once the deferred frames exist (see when_ready)
 
-        # Pass references for inter-frame communication
-        # Action/Output frame needs access to input/option variables
-        self.action_output_frame.input_output_frame = self.input_output_frame
-        self.action_output_frame.options_frame = self.advanced_options_frame # Pass the OptionsFrame instance
+        self._build_primary()
+        self.after_idle(self._build_secondary)
 
-        # Options frame might need to trigger actions in Action/Output frame (e.g., List Streams)
-        self.advanced_options_frame.action_output_frame = self.action_output_frame
-        # Input/Output frame might need to trigger auto-filename update or log
-        self.input_output_frame.action_output_frame = self.action_output_frame
+    def _build_primary(self):
+        """Builds the frames needed for the first paint."""
+        InputOutputFrame = _frame_class("InputOutputFrame")
 
+        # The options frame becomes reachable through the context once _build_secondary creates it
+        self.input_output_frame = InputOutputFrame(self.left_frame, config_manager=self.config_manager, signal_bus=self.bus)
+        self.ctx.io = self.input_output_frame
+        self.input_output_frame.bind_context(self.ctx)
 
         # --- Place Sub-Frames in Grid ---
-        self.input_output_frame.grid(row=0, column=0, padx=10, pady=(10, 5), sticky="ew")
-
-        # Place core options directly in main frame for now, or create a dedicated frame if needed - Removed placeholder logic
-
-        # Revised grid layout:
+        # Layout (left pane | right pane):
         # Row 0: Input/Output Frame | Queue Frame
         # Row 1: Options Frame      | Queue Frame
         # Row 2: Action/Output Frame| Queue Frame
+        # Placed through CTk's grid() (not a raw "grid configure" Tcl call): the wrapper scales padx/pady
+        # for the current DPI, and each sub-frame is gridded exactly once.
+        self.input_output_frame.grid(row=0, column=0, padx=PAD, pady=(PAD, GAP), sticky="ew")
+
+    def _build_secondary(self):
+        """Builds the remaining frames after the window has had a chance to paint."""
+        OptionsFrame = _frame_class("OptionsFrame")
+        ActionOutputFrame = _frame_class("ActionOutputFrame")
 
-        # The following explicit re-configuration of rows 0,1,2 is fine.
-        # It correctly sets weights for the frames in column 0.
-        # input_output_frame (row 0, col 0) should not expand vertically.
-        # advanced_options_frame (row 1, col 0) should not expand vertically.
-        # action_output_frame (row 2, col 0) should expand vertically.
-        self.grid_rowconfigure(0, weight=0) # Input/Output
-        self.grid_rowconfigure(1, weight=0) # Options (Tabs)
-        self.grid_rowconfigure(2, weight=1) # Action/Output (expands in col 0)
+        # Create the frames
+        self.advanced_options_frame = OptionsFrame(self.left_frame, config_manager=self.config_manager, signal_bus=self.bus) # OptionsFrame will handle tabs
+        self.action_output_frame = ActionOutputFrame(self.left_frame, config_manager=self.config_manager, output_queue=self.output_queue, signal_bus=self.bus)
 
+        # Make the frames reachable by their siblings (frames resolve these lazily through the context)
+        self.ctx.options = self.advanced_options_frame
+        self.ctx.action = self.action_output_frame
+        for frame in (self.advanced_options_frame, self.action_output_frame):
+            frame.bind_context(self.ctx)
 
-        self.input_output_frame.grid(row=0, column=0, padx=10, pady=(10, 5), sticky="ew")
-        self.advanced_options_frame.grid(row=1, column=0, padx=10, pady=5, sticky="ew") # Use the actual OptionsFrame instance
-        self.action_output_frame.grid(row=2, column=0, padx=10, pady=(5, 10), sticky="nsew") # Action/Output expands
+        self.advanced_options_frame.grid(row=1, column=0, padx=PAD, pady=GAP, sticky="ew") # Use the actual OptionsFrame instance
+        self.action_output_frame.grid(row=2, column=0, padx=PAD, pady=(GAP, PAD), sticky="nsew") # Action/Output expands
 
-        # Queue Frame
-        self.queue_frame = QueueFrame(self, config_manager=self.config_manager, options_frame=self.advanced_options_frame, width=400) # Added width
-        self.queue_frame.grid(row=0, column=1, rowspan=3, padx=(0,10), pady=(10,10), sticky="nsew")
+        # Queue Frame is built on demand (see open_queue); until then a single button stands in for it.
+        # Nothing at all is built for the queue while the panel is switched off in the settings.
+        if self._show_queue:
+            self._add_queue_placeholder()
+        self.bus.on("options.show_queue_panel", self.set_queue_panel_visible)
 
-        # Pass references for inter-frame communication (continued)
-        self.action_output_frame.queue_frame = self.queue_frame
-        self.queue_frame.action_output_frame = self.action_output_frame
+        self._frames_ready = True
+        callbacks, self._ready_callbacks = self._ready_callbacks, []
+        for callback in callbacks:
+            callback()
 
+    def _add_queue_placeholder(self):
+        """Shows the button that stands in for the not yet built queue panel."""
+        import tkinterdnd2 # For dropping files onto the queue placeholder
+        self._queue_placeholder = ctk.CTkButton(self.paned, text="Queue ▸", width=80, command=self.open_queue)
+        self._queue_placeholder.drop_target_register(tkinterdnd2.DND_FILES)
+        self._queue_placeholder.dnd_bind('<<Drop>>', self._drop_on_queue_placeholder)
+        self.paned.add(self._queue_placeholder, weight=0)
+
+    def _is_pane(self, widget):
+        """Returns True if widget is currently shown as a pane of the paned window."""
+        return str(widget) in map(str, self.paned.panes())
+
+    def set_queue_panel_visible(self, visible):
+        """Shows or hides the queue panel (or its placeholder). A built queue keeps its items while hidden."""
+        self._show_queue = visible
+        pane = self.queue_frame or self._queue_placeholder
+        if visible:
+            if pane is None:
+                self._add_queue_placeholder()
+            elif not self._is_pane(pane):
+                self.paned.add(pane, weight=1 if pane is self.queue_frame else 0)
+        elif pane is not None and self._is_pane(pane):
+            self.paned.forget(pane)
+
+    def open_queue(self):
+        """Builds the queue panel in place of its placeholder (once) and returns it."""
+        if self.queue_frame is not None:
+            return self.queue_frame
+        QueueFrame = _frame_class("QueueFrame")
+
+        if self._queue_placeholder is not None:
+            if self._is_pane(self._queue_placeholder):
+                self.paned.forget(self._queue_placeholder)
+            self._queue_placeholder.destroy()
+            self._queue_placeholder = None
+
+        self.queue_frame = QueueFrame(self.paned, config_manager=self.config_manager, options_frame=None, width=400, signal_bus=self.bus) # Added width
+        if self._show_queue: # A saved queue is still loaded while the panel is switched off, just not shown
+            self.paned.add(self.queue_frame, weight=1)
+        self.ctx.queue = self.queue_frame
+        self.queue_frame.bind_context(self.ctx)
+        self.bus.emit("queue.opened")
+        return self.queue_frame
+
+    def _drop_on_queue_placeholder(self, event):
+        """Files dropped on the collapsed queue open it and are queued as if dropped on the panel."""
+        return self.open_queue().handle_drop(event)
+
+    def drain_output(self):
+        """
+        Returns every pending output line without blocking (oldest first). Not capped: with a fixed
+        poll interval a cap would let verbose output fall further and further behind.
+        """
+        items = []
+        get = self.output_queue.get_nowait
+        try:
+            while True:
+                items.append(get())
+        except queue.Empty:
+            pass
+        return items
+
+    def when_ready(self, callback):
+        """Calls callback once all sub-frames exist (immediately if they already do)."""
+        if self._frames_ready:
+            callback()
+        else:
+            self._ready_callbacks.append(callback)
+
+
+# Placeholder module body written by the demo below for any missing sibling module
+_DUMMY_MODULE_SOURCE = b"""\
+# Dummy file for testing
+import customtkinter as ctk
+class DummyFrame(ctk.CTkFrame):
+    def __init__(self, master, **kwargs):
+        super().__init__(master, **kwargs)
+        ctk.CTkLabel(self, text=f'{self.__class__.__name__} Placeholder').pack()
+class InputOutputFrame(DummyFrame): pass
+class OptionsFrame(DummyFrame): pass
+class ActionOutputFrame(DummyFrame): pass
+class ConfigManager: def load_config(self): return {}; def save_config(self, c): pass
+class Tooltip: def __init__(self, w, t): pass
+import queue; queue.Queue = lambda: [] # Mock queue for dummy frames
+"""
 
 # Example Usage (for testing purposes, requires other modules)
 if __name__ == "__main__":
-    # This example requires the other gui modules to exist, even if empty
-    # Create dummy files if they don't exist for testing the main frame layout
     import os
     from pathlib import Path
-    dummy_files = [
-        "cleanvidgui_input_output.py",
-        "cleanvidgui_options.py",
-        "cleanvidgui_action_output.py",
-        "cleanvidgui_config.py",
-        "cleanvidgui_tooltip.py",
-    ]
-    gui_dir = Path(__file__).parent
-    for fname in dummy_files:
-        if not (gui_dir / fname).exists():
-            with open(gui_dir / fname, 'w') as f:
-                f.write("# Dummy file for testing\n")
-                f.write("import customtkinter as ctk\n")
-                f.write("class DummyFrame(ctk.CTkFrame):\n")
-                f.write("    def __init__(self, master, **kwargs):\n")
-                f.write("        super().__init__(master, **kwargs)\n")
-                f.write("        ctk.CTkLabel(self, text=f'{self.__class__.__name__} Placeholder').pack()\n")
-                f.write("class InputOutputFrame(DummyFrame): pass\n")
-                f.write("class OptionsFrame(DummyFrame): pass\n")
-                f.write("class ActionOutputFrame(DummyFrame): pass\n")
-                f.write("class ConfigManager: def load_config(self): return {}; def save_config(self, c): pass\n")
-                f.write("class Tooltip: def __init__(self, w, t): pass\n")
-                f.write("import queue; queue.Queue = lambda: [] # Mock queue\n") # Mock queue for dummy frames
+
+    # This example requires the other gui modules to exist, even if empty.
+    # Set CLEANVID_GUI_DEMO=1 to create dummy files for any that are missing.
+    if os.environ.get("CLEANVID_GUI_DEMO"):
+        dummy_files = [
+            "cleanvidgui_input_output.py",
+            "cleanvidgui_options.py",
+            "cleanvidgui_action_output.py",
+            "cleanvidgui_config.py",
+            "cleanvidgui_tooltip.py",
+        ]
+        gui_dir = Path(__file__).parent
+        existing = set(os.listdir(gui_dir)) # One directory listing instead of a stat per file
+        for fname in dummy_files:
+            if fname not in existing:
+                (gui_dir / fname).write_bytes(_DUMMY_MODULE_SOURCE)
 
     # Now import the dummy/real modules
     from .cleanvidgui_config import ConfigManager
     import queue # Use real queue for the app
 
+    # Pin scaling before any widget exists so the demo never runs CTk's DPI re-layout pass
+    ctk.deactivate_automatic_dpi_awareness()
+    ctk.set_widget_scaling(1.0)
+    ctk.set_window_scaling(1.0)
+
     root = ctk.CTk()
     root.title("Main Frame Demo")
     root.geometry("800x750") # Use a size similar to the planned default
@@ -129,4 +262,4 @@ if __name__ == "__main__":
     main_frame = CleanVidMainFrame(root, config_manager=config_manager, output_queue=output_queue)
     main_frame.pack(fill="both", expand=True, padx=10, pady=10) # Use pack for the main frame in the root window
 
-    root.mainloop()
\ No newline at end of file
+    root.mainloop()
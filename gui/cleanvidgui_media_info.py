@@ -0,0 +1,80 @@
+import json
+import os
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Audio stream info per file: path -> ((st_mtime_ns, st_size), streams). An entry is only used
+# while the file's size and mtime still match, so replaced or edited files are probed again.
+_cache = {}
+_cache_lock = threading.Lock()
+_executor = None # Created on first prefetch()
+
+def _stat_key(path):
+    """Returns (st_mtime_ns, st_size) for path, or None if it can't be stat'ed."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+def cached_audio_streams(path):
+    """Returns the cached audio streams for path, or None if not probed yet or the file changed since."""
+    key = _stat_key(path)
+    with _cache_lock:
+        entry = _cache.get(path)
+    if key is None or entry is None or entry[0] != key:
+        return None
+    return entry[1]
+
+def probe_audio_streams(path):
+    """
+    Returns the audio streams of path as ffprobe stream dicts (same query as cleanvid's
+    --audio-stream-list), running ffprobe only if there is no valid cached result. None on failure.
+    """
+    key = _stat_key(path)
+    if key is None:
+        return None
+    with _cache_lock:
+        entry = _cache.get(path)
+    if entry is not None and entry[0] == key:
+        return entry[1]
+
+    cmd = ["ffprobe", "-loglevel", "quiet", "-select_streams", "a",
+           "-show_entries", "stream=index,codec_name,sample_rate,channel_layout:stream_tags=language",
+           "-of", "json", path]
+    try:
+        result = subprocess.run(
+            cmd, capture_output=True, timeout=60,
+            creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        print(f"Warning: ffprobe failed for '{path}': {e}")
+        return None
+    if result.returncode != 0:
+        return None
+    try:
+        streams = json.loads(result.stdout).get("streams", [])
+    except ValueError:
+        return None
+
+    with _cache_lock:
+        _cache[path] = (key, streams)
+    return streams
+
+def prefetch(paths):
+    """Probes paths on a small background pool, so a later stream listing for them is instant."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cleanvid-probe")
+    for path in paths:
+        _executor.submit(probe_audio_streams, path)
+
+def format_audio_streams(streams):
+    """Formats stream dicts one per line, the way cleanvid.py --audio-stream-list prints them."""
+    return "\n".join(
+        f"{x['index']}: {x.get('codec_name', 'unknown codec')}, {x.get('sample_rate', 'unknown')} Hz, "
+        f"{x.get('channel_layout', 'unknown channel layout')}, {x.get('tags', {}).get('language', 'unknown language')}"
+        for x in streams
+    )
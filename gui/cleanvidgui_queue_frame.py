@@ -1,20 +1,75 @@
 import customtkinter as ctk
-from .cleanvidgui_tooltip import Tooltip
+from .cleanvidgui_tooltip import Tooltip, SharedTooltip
+from .cleanvidgui_config import _HOME, VIDEO_EXT_ORDER, VIDEO_EXTS, orjson # orjson is None when not installed
 import os
 from tkinter import filedialog
 import copy # For deepcopy
+import json
+import functools
+from types import MappingProxyType
 import tkinter.messagebox as messagebox # Added for help dialog
 import tkinterdnd2 # For drag-and-drop
 import re # For parsing DND strings
+import tkinter as tk
+from collections import deque
+from .cleanvidgui_signals import ContextBound, context_reference
+from . import cleanvidgui_media_info as media_info
+
+# Fallback DND splitter: a {braced path} or a run of non-space characters
+_DND_PATH_RE = re.compile(r'\{([^{}]*)\}|(\S+)')
+
+_IMMUTABLES = (str, int, float, bool, type(None), tuple, bytes, frozenset)
+
+def _fast_copy_settings(value):
+    """
+    Deep copy for settings data: immutable leaves are shared, dicts (and read-only settings proxies,
+    which come back as plain dicts) and lists are rebuilt, anything else goes through copy.deepcopy.
+    """
+    if isinstance(value, _IMMUTABLES):
+        return value
+    if isinstance(value, (dict, MappingProxyType)):
+        return {key: _fast_copy_settings(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_fast_copy_settings(item) for item in value]
+    return copy.deepcopy(value)
+
+@functools.lru_cache(maxsize=128)
+def _format_settings_items(sorted_items):
+    """Formats sorted (key, value) settings pairs as tooltip lines; cached per distinct settings set."""
+    return "\n".join(f"{key.replace('_', ' ').title()}: {value}" for key, value in sorted_items)
+
+def _parse_item_id(item):
+    """Returns the number of an "item_<n>" queue id, or None if the item has no such id."""
+    try:
+        return int(item["id"].rsplit("_", 1)[-1])
+    except (KeyError, AttributeError, TypeError, ValueError):
+        return None
+
+class QueueFrame(ContextBound, ctk.CTkFrame):
+    # Sibling frames, resolved through the shared context unless passed in explicitly
+    options_frame = context_reference("options")
+    action_output_frame = context_reference("action")
 
-class QueueFrame(ctk.CTkFrame):
-    def __init__(self, master, config_manager, options_frame, action_output_frame=None, width=200):
+    _FILE_TYPES = (
+        ("Video files", " ".join("*" + ext for ext in VIDEO_EXT_ORDER)),
+        ("All files", "*.*")
+    )
+
+    def __init__(self, master, config_manager, options_frame, action_output_frame=None, width=200, signal_bus=None):
         super().__init__(master, width=width)
         self.config_manager = config_manager
+        self.signal_bus = signal_bus
         self.options_frame = options_frame
         self.action_output_frame = action_output_frame
-        self.queue_items = []
+        self.queue_items = deque() # Processed from the front (see get_next_item_for_processing)
+        self._in_flight_item = None # Taken for processing; its row stays (first) until finish_item()
         self.item_id_counter = 0
+        self._settings_cache = {} # Canonical JSON of a settings snapshot -> shared read-only copy (emptied with the queue)
+        self._item_widgets = {} # Item id -> {"item", "label", "delete", "row"} for the rows currently shown
+        self._next_grid_row = 0 # Grid row for the next appended row (rows only move on a full sync)
+        self.empty_queue_label = None
+        self._pending_button_update = False # A queue.updated notification is already scheduled
+        self._update_pending = False # A full row sync is already scheduled (see _schedule_update)
 
         self.grid_rowconfigure(0, weight=0)
         self.grid_rowconfigure(1, weight=1)
@@ -42,45 +97,24 @@ class QueueFrame(ctk.CTkFrame):
 
         self.scrollable_frame = ctk.CTkScrollableFrame(self, label_text="Queue")
         self.scrollable_frame.grid(row=1, column=0, padx=5, pady=5, sticky="nsew")
+        self.scrollable_frame.grid_columnconfigure(0, weight=1) # File name column of the queue rows
+
+        # One tooltip serves every queue row (texts are registered per row widget in _sync_rows)
+        self._row_tooltip = SharedTooltip(self.scrollable_frame)
 
         # Register scrollable_frame as a drop target
         self.scrollable_frame.drop_target_register(tkinterdnd2.DND_FILES)
         self.scrollable_frame.dnd_bind('<<Drop>>', self.handle_drop)
 
-        self.update_queue_display() # Initial display
+        self._schedule_update() # Initial display
 
     def _parse_dnd_data(self, data_string):
         """Parses the string data from a DND event into a list of file paths."""
-        paths = []
-        current_path = ""
-        in_brace = False
-        # Iterate through the string, including a dummy space at the end to finalize the last path
-        for char in data_string + " ":
-            if char == '{':
-                if not in_brace: # Start of a new braced path
-                    if current_path.strip(): # Path before brace (shouldn't usually happen if well-formed)
-                        paths.append(current_path.strip())
-                    current_path = ""
-                    in_brace = True
-                else: # Nested brace, treat as part of the path
-                    current_path += char
-            elif char == '}':
-                if in_brace:
-                    in_brace = False
-                    if current_path.strip():
-                        paths.append(current_path.strip())
-                    current_path = ""
-                else: # Unmatched closing brace, treat as part of path
-                    current_path += char
-            elif char == ' ' and not in_brace: # Space delimiter, only if not inside braces
-                if current_path.strip():
-                    paths.append(current_path.strip())
-                current_path = ""
-            else:
-                current_path += char
-
-        # Clean up any empty strings that might have resulted
-        return [p for p in paths if p]
+        # DND data is a Tcl list ({braced} paths contain spaces), which Tcl itself splits fastest
+        try:
+            return [p for p in self.tk.splitlist(data_string) if p]
+        except tk.TclError: # Not a well-formed Tcl list (e.g. unbalanced braces)
+            return [braced or bare for braced, bare in _DND_PATH_RE.findall(data_string)]
 
     def handle_drop(self, event):
         """Handles files dropped onto the scrollable_frame."""
@@ -99,36 +133,60 @@ class QueueFrame(ctk.CTkFrame):
 
         # print(f"Parsed DND paths: {file_paths}") # For debugging parsed paths
 
-        valid_files = [p for p in file_paths if os.path.isfile(p)]
+        # Basic video file extension check first (extend VIDEO_EXT_ORDER in cleanvidgui_config to accept more), so only
+        # video paths cost a stat; those stats then run back to back
+        video_paths = []
+        for file_path in file_paths:
+            if os.path.splitext(file_path)[1].lower() in VIDEO_EXTS:
+                video_paths.append(file_path)
+            else:
+                print(f"Skipped non-video file: {file_path}")
+        valid_files = [p for p in video_paths if os.path.isfile(p)]
 
         if not valid_files:
-            print(f"No valid files found in drop: {file_paths}")
-            return
-
-        if valid_files:
-            current_settings_snapshot = copy.deepcopy(self.options_frame.get_state())
-            added_count = 0
-            for file_path in valid_files:
-                # Basic video file extension check (can be expanded)
-                if file_path.lower().endswith(('.mp4', '.mkv', '.avi', '.mov', '.webm', '.flv', '.wmv')):
-                    queue_item = {
-                        "id": f"item_{self.item_id_counter}",
-                        "file_path": file_path,
-                        "settings": copy.deepcopy(current_settings_snapshot)
-                    }
-                    self.queue_items.append(queue_item)
-                    self.item_id_counter += 1
-                    added_count +=1
-                else:
-                    print(f"Skipped non-video file: {file_path}")
-
-            if added_count > 0:
-                self.update_queue_display()
-                if self.action_output_frame:
-                    self.action_output_frame.update_clean_button_state()
-            else:
+            if video_paths:
+                print(f"No valid files found in drop: {video_paths}")
+            elif file_paths:
                 messagebox.showwarning("No Video Files", "No valid video files were found in the dropped items.")
+            else:
+                print(f"No valid files found in drop: {file_paths}")
+            return
 
+        # One snapshot per drop, shared by every file in it (and by earlier items with the same settings)
+        current_settings_snapshot = self._intern_settings(self.options_frame.get_state())
+        new_items = []
+        for file_path in valid_files:
+            queue_item = {
+                "id": f"item_{self.item_id_counter}",
+                "file_path": file_path,
+                "settings": current_settings_snapshot
+            }
+            self._add_display_fields(queue_item) # Basename is stored once here, not per redraw
+            new_items.append(queue_item)
+            self.item_id_counter += 1
+
+        media_info.prefetch(valid_files)
+        self._append_items(new_items)
+
+
+    def _schedule_button_update(self):
+        """Notifies queue listeners once per idle cycle, however many queue changes happen before it."""
+        if self._pending_button_update:
+            return
+        self._pending_button_update = True
+        self.after_idle(self._run_button_update)
+
+    def _run_button_update(self):
+        """after_idle() callback for _schedule_button_update."""
+        self._pending_button_update = False
+        self._notify_queue_updated()
+
+    def _notify_queue_updated(self):
+        """Lets listeners (e.g. the action frame's Clean/Run Queue button) know the queue changed."""
+        if self.signal_bus:
+            self.signal_bus.emit("queue.updated")
+        elif self.action_output_frame:
+            self.action_output_frame.update_clean_button_state()
 
     def get_item_count(self):
         return len(self.queue_items)
@@ -139,97 +197,224 @@ class QueueFrame(ctk.CTkFrame):
         return None
 
     def get_next_item_for_processing(self):
+        """
+        Takes the next item off the queue. Its row stays shown (with its delete button disabled) so
+        update_item_status() can show progress on it, until finish_item() or the next call removes it.
+        """
+        if self._in_flight_item is not None: # Not finished explicitly (e.g. skipped or failed to start)
+            self.finish_item(self._in_flight_item["id"])
         if self.queue_items:
-            item = self.queue_items.pop(0)
-            self.update_queue_display()
+            item = self._in_flight_item = self.queue_items.popleft()
+            widgets = self._item_widgets.get(item["id"])
+            if widgets is not None:
+                widgets["delete"].configure(state="disabled")
+            self._schedule_button_update() # Item count changed
             return item
         return None
 
+    def finish_item(self, item_id, status_message=None):
+        """Ends processing of the in-flight item: logs its final status (if given) and removes its row."""
+        if status_message is not None:
+            self.update_item_status(item_id, status_message)
+        if self._in_flight_item is not None and self._in_flight_item["id"] == item_id:
+            self._in_flight_item = None
+            self._redraw(self._destroy_item_widget, item_id)
+
     def update_item_status(self, item_id, status_message):
         print(f"Queue Item {item_id} status: {status_message}")
+        widgets = self._item_widgets.get(item_id)
+        if widgets is not None: # Still shown: update its label in place (no redraw)
+            item = widgets["item"]
+            item["_status"] = status_message
+            widgets["label"].configure(text=self._row_text(item))
         if self.action_output_frame:
             self.action_output_frame.log_output(f"Item {item_id}: {status_message}\n", main_log=False)
 
     def add_files_dialog(self):
-        file_types = [
-            ("Video files", "*.mp4 *.mkv *.avi *.mov *.webm *.flv *.wmv"), # Added more common types
-            ("All files", "*.*")
-        ]
         selected_files = filedialog.askopenfilenames(
             title="Select video files to add to queue",
-            filetypes=file_types
+            initialdir=self.config_manager.get_last_dir("queue_add") or _HOME,
+            filetypes=self._FILE_TYPES
         )
 
         if selected_files:
-            current_settings_snapshot = self.options_frame.get_state()
+            self.config_manager.set_last_dir("queue_add", os.path.dirname(selected_files[0]))
+            # One snapshot per dialog, shared by every file in it (and by earlier items with the same settings)
+            current_settings_snapshot = self._intern_settings(self.options_frame.get_state())
+            new_items = []
             for file_path in selected_files:
                 queue_item = {
                     "id": f"item_{self.item_id_counter}",
                     "file_path": file_path,
-                    "settings": copy.deepcopy(current_settings_snapshot)
+                    "settings": current_settings_snapshot
                 }
-                self.queue_items.append(queue_item)
+                self._add_display_fields(queue_item)
+                new_items.append(queue_item)
                 self.item_id_counter += 1
-            self.update_queue_display()
+            media_info.prefetch(selected_files) # Stream info is then ready before it is asked for
+            self._append_items(new_items)
 
     def remove_item(self, item_id_to_remove):
-        self.queue_items = [item for item in self.queue_items if item['id'] != item_id_to_remove]
-        self.update_queue_display()
+        self.queue_items = deque(item for item in self.queue_items if item['id'] != item_id_to_remove)
+        self._redraw(self._destroy_item_widget, item_id_to_remove) # Only that item's row changes
 
     def clear_queue(self):
-        self.queue_items = []
-        self.update_queue_display()
+        self.queue_items = deque()
+        self._schedule_update()
+
+    def _intern_settings(self, settings):
+        """
+        Returns a read-only copy of settings, shared by every queue item with identical settings.
+        Items never modify their settings; the proxy makes an accidental write raise.
+        A read-only snapshot (OptionsFrame.get_state()) is shared as is, without a copy.
+        """
+        key = json.dumps(settings, sort_keys=True, default=dict)
+        shared = self._settings_cache.get(key)
+        if shared is None:
+            if not isinstance(settings, MappingProxyType):
+                settings = MappingProxyType(_fast_copy_settings(settings))
+            shared = self._settings_cache[key] = settings
+        return shared
+
+    def _add_display_fields(self, item):
+        """
+        Stores the row label on the item itself, so redraws don't recompute it (the tooltip text
+        follows on first hover, see _item_tooltip_text).
+        Underscore keys are display-only and left out of get_persistable_queue().
+        """
+        item["_basename"] = os.path.basename(item["file_path"])
+
+    def _row_text(self, item):
+        """Returns the row label of item: its file name, followed by its last status if it has one."""
+        status = item.get("_status")
+        return f"{item['_basename']} ({status})" if status else item["_basename"]
+
+    def _item_tooltip_text(self, item):
+        """Returns the settings tooltip of item, formatted on first hover and then kept on the item."""
+        text = item.get("_tooltip_text")
+        if text is None:
+            text = item["_tooltip_text"] = self._format_settings_for_tooltip(item["settings"])
+        return text
 
     def _format_settings_for_tooltip(self, settings_dict):
         if not settings_dict:
             return "No specific settings applied."
-        lines = []
-        for key, value in sorted(settings_dict.items()):
-            lines.append(f"{key.replace('_', ' ').title()}: {value}")
-        return "\n".join(lines)
+        sorted_items = tuple(sorted(settings_dict.items()))
+        try:
+            return _format_settings_items(sorted_items)
+        except TypeError: # Unhashable value (e.g. from a hand-edited saved queue); format without the cache
+            return _format_settings_items.__wrapped__(sorted_items)
 
     def update_queue_display(self):
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-
-        if not self.queue_items:
-            self.empty_queue_label = ctk.CTkLabel(
-                self.scrollable_frame,
-                text="Drop video files here, or click '+' to add to the queue.\n" # Updated text
-                     "Locked settings from the Options panel will apply to each batch.\n"
-                     "Use '?' for more details.",
-                wraplength=380,
-                justify="center"
-            )
-            self.empty_queue_label.pack(padx=10, pady=20, expand=True, fill="both")
-        else:
-            for item_data in self.queue_items:
-                item_frame = ctk.CTkFrame(self.scrollable_frame)
-                item_frame.pack(fill='x', pady=2, padx=2)
+        """Brings every row in sync with self.queue_items (see _sync_rows)."""
+        self._redraw(self._sync_rows)
 
-                item_frame.grid_columnconfigure(0, weight=1)
-                item_frame.grid_columnconfigure(1, weight=0)
+    def _schedule_update(self):
+        """Runs update_queue_display once per idle cycle, however many queue changes request it before then."""
+        if self._update_pending:
+            return
+        self._update_pending = True
+        self.after_idle(self._flush_update)
 
-                base_name = os.path.basename(item_data['file_path'])
-                label = ctk.CTkLabel(item_frame, text=base_name, anchor="w")
-                label.grid(row=0, column=0, padx=5, pady=5, sticky="ew")
+    def _flush_update(self):
+        """after_idle() callback for _schedule_update."""
+        self._update_pending = False
+        self.update_queue_display()
 
-                item_id = item_data["id"]
-                delete_button = ctk.CTkButton(
-                    item_frame, text="🗑", width=30, fg_color="transparent",
-                    hover_color="gray25", command=lambda id_val=item_id: self.remove_item(id_val)
+    def _redraw(self, build, *args):
+        """Runs build(*args) and updates the empty-queue hint; Tk lays the rows out once, when idle."""
+        build(*args)
+        if not self.queue_items and self._in_flight_item is None:
+            self._settings_cache.clear() # No item holds a shared settings copy any more
+        self._update_empty_label()
+        self._schedule_button_update()
+
+    def _update_empty_label(self):
+        """Shows the empty-queue hint while the queue is empty (and nothing is processing), and removes it otherwise."""
+        if not self.queue_items and self._in_flight_item is None:
+            if self.empty_queue_label is None:
+                self.empty_queue_label = ctk.CTkLabel(
+                    self.scrollable_frame,
+                    text="Drop video files here, or click '+' to add to the queue.\n" # Updated text
+                         "Locked settings from the Options panel will apply to each batch.\n"
+                         "Use '?' for more details.",
+                    wraplength=380,
+                    justify="center"
                 )
-                delete_button.grid(row=0, column=1, padx=5, pady=5, sticky="e")
-
-                tooltip_text = self._format_settings_for_tooltip(item_data['settings'])
-                Tooltip(item_frame, tooltip_text)
-                Tooltip(label, tooltip_text)
-                Tooltip(delete_button, f"Remove {base_name} from queue")
-
-        self.scrollable_frame.update_idletasks()
-
-        if self.action_output_frame:
-            self.action_output_frame.update_clean_button_state()
+                self.empty_queue_label.grid(row=0, column=0, columnspan=2, padx=10, pady=20, sticky="nsew")
+        elif self.empty_queue_label is not None:
+            self.empty_queue_label.destroy()
+            self.empty_queue_label = None
+
+    def _append_items(self, new_items):
+        """Adds new items to the end of the queue, building rows for those items only."""
+        if new_items:
+            self.queue_items.extend(new_items)
+            if self._update_pending: # The scheduled full sync builds their rows along with the rest
+                return
+            self._redraw(self._create_rows, new_items)
+
+    def _create_rows(self, new_items):
+        """Builds rows for items appended to the queue, below every existing row."""
+        for item_data in new_items:
+            self._create_item_widget(item_data, self._next_grid_row)
+            self._next_grid_row += 1
+
+    def _create_item_widget(self, item_data, row):
+        """
+        Builds one queue row: a label and a delete button gridded straight into the scrollable
+        frame (no per-row container frame), with their texts registered on the shared tooltip.
+        """
+        item_id = item_data["id"]
+        label = ctk.CTkLabel(self.scrollable_frame, text=self._row_text(item_data), anchor="w")
+        delete_button = ctk.CTkButton(
+            self.scrollable_frame, text="🗑", width=30, fg_color="transparent",
+            hover_color="gray25", command=functools.partial(self.remove_item, item_id),
+            state="disabled" if item_data is self._in_flight_item else "normal" # Processing can't be removed
+        )
+        label.grid(row=row, column=0, padx=(7,5), pady=2, sticky="ew")
+        delete_button.grid(row=row, column=1, padx=5, pady=2, sticky="e")
+        self._row_tooltip.set_text(label, functools.partial(self._item_tooltip_text, item_data))
+        self._row_tooltip.set_text(delete_button, f"Remove {item_data['_basename']} from queue")
+        self._item_widgets[item_id] = {"item": item_data, "label": label, "delete": delete_button, "row": row}
+
+    def _destroy_item_widget(self, item_id):
+        """Destroys the row of item_id, if it has one. Rows below keep their grid row (empty rows take no space)."""
+        widgets = self._item_widgets.pop(item_id, None)
+        if widgets is not None:
+            for widget in (widgets["label"], widgets["delete"]):
+                self._row_tooltip.forget(widget)
+                widget.destroy()
+
+    def _sync_rows(self):
+        """
+        Brings the rows in sync with self.queue_items. Rows of removed items are destroyed, only new
+        items get widgets, and surviving rows have their text and tooltips updated in place.
+        Rows are re-gridded compactly in queue order (below the in-flight item's row, if any);
+        a row only moves when its position changed.
+        """
+        shown_items = list(self.queue_items)
+        if self._in_flight_item is not None:
+            shown_items.insert(0, self._in_flight_item)
+        current_ids = {item["id"] for item in shown_items}
+        for item_id in [item_id for item_id in self._item_widgets if item_id not in current_ids]:
+            self._destroy_item_widget(item_id)
+
+        for row, item_data in enumerate(shown_items):
+            widgets = self._item_widgets.get(item_data["id"])
+            if widgets is None:
+                self._create_item_widget(item_data, row)
+                continue
+            base_name = item_data["_basename"]
+            widgets["item"] = item_data
+            widgets["label"].configure(text=self._row_text(item_data))
+            self._row_tooltip.set_text(widgets["label"], functools.partial(self._item_tooltip_text, item_data))
+            self._row_tooltip.set_text(widgets["delete"], f"Remove {base_name} from queue")
+            if widgets["row"] != row:
+                widgets["label"].grid(row=row, column=0, padx=(7,5), pady=2, sticky="ew")
+                widgets["delete"].grid(row=row, column=1, padx=5, pady=2, sticky="e")
+                widgets["row"] = row
+        self._next_grid_row = len(shown_items)
 
     def show_queue_help(self):
         title = "Cleanvid Queue Help"
@@ -248,29 +433,38 @@ Note: Each file in the queue is processed as an independent job with its own set
         messagebox.showinfo(title, help_message)
 
     def get_persistable_queue(self):
-        return copy.deepcopy(self.queue_items)
-
-    def repopulate_from_saved(self, saved_queue_items):
+        # Display-only "_" keys are rebuilt on load (see _add_display_fields), so they are not saved
+        items = [{key: value for key, value in item.items() if not key.startswith("_")} for item in self.queue_items]
+        # A JSON round trip is a much faster deep copy of this JSON-only data (proxies become plain dicts),
+        # done by orjson when it is installed
+        try:
+            if orjson is not None:
+                return orjson.loads(orjson.dumps(items, default=dict))
+            return json.loads(json.dumps(items, default=dict))
+        except (TypeError, ValueError) as e: # Something that isn't JSON got into an item
+            print(f"Warning: Falling back to deepcopy for saved queue: {e}")
+        return [_fast_copy_settings(item) for item in items] # Also unwraps the settings proxies
+
+    def repopulate_from_saved(self, saved_queue_items, saved_counter=None):
+        """
+        Restores saved queue items. saved_counter is the saved item_id_counter (None for older configs).
+        Takes ownership of saved_queue_items: the list and its item dicts are used (and modified) in place,
+        so callers must not keep using them.
+        """
         if saved_queue_items is not None and isinstance(saved_queue_items, list):
-            self.queue_items = copy.deepcopy(saved_queue_items)
-            if self.queue_items:
-                max_id = 0
-                for item in self.queue_items:
-                    try:
-                        item_id_str = item.get("id", "item_0")
-                        if isinstance(item_id_str, str):
-                            num_part = int(item_id_str.split("_")[-1])
-                            if num_part > max_id:
-                                max_id = num_part
-                        else:
-                            print(f"Warning: Unexpected item ID type: {item_id_str} in saved queue.")
-                    except ValueError:
-                        print(f"Warning: Could not parse ID number from '{item.get('id')}' in saved queue.")
-                    except AttributeError:
-                        print(f"Warning: ID attribute error for item '{item.get('id')}' in saved queue.")
-                self.item_id_counter = max_id + 1
+            self.queue_items = deque(saved_queue_items)
+            for item in self.queue_items:
+                # Saved items come back with one settings dict each; share them again like at add time
+                if isinstance(item.get("settings"), dict):
+                    item["settings"] = self._intern_settings(item["settings"])
+                self._add_display_fields(item)
+            if self.queue_items and isinstance(saved_counter, int):
+                self.item_id_counter = saved_counter
+            elif self.queue_items: # Older config without a saved counter: derive it from the item ids
+                id_numbers = [_parse_item_id(item) for item in self.queue_items]
+                if None in id_numbers:
+                    print(f"Warning: Could not parse {id_numbers.count(None)} item ID(s) in saved queue.")
+                self.item_id_counter = max((n for n in id_numbers if n is not None), default=0) + 1
             else:
                 self.item_id_counter = 0
-            self.update_queue_display()
-            if self.action_output_frame:
-                self.action_output_frame.update_clean_button_state()
+            self._schedule_update()
@@ -0,0 +1,80 @@
+class SignalBus:
+    """
+    Lightweight publish/subscribe hub shared by the GUI frames.
+    Frames subscribe to and emit named signals (e.g. "queue.updated") instead of
+    calling into sibling frames directly.
+    """
+    def __init__(self, root=None):
+        self._listeners = {} # signal name -> list of callbacks
+        self._root = root # Widget whose after() schedules debounced emits
+        self._pending = {} # signal name -> after() id of its scheduled debounced emit
+
+    def on(self, key, callback):
+        """Subscribes callback to the signal key."""
+        self._listeners.setdefault(key, []).append(callback)
+
+    def off(self, key, callback):
+        """Unsubscribes callback from the signal key, if subscribed."""
+        listeners = self._listeners.get(key)
+        if listeners and callback in listeners:
+            listeners.remove(callback)
+
+    def emit_debounced(self, key, *args, delay_ms=50, **kwargs):
+        """
+        Emits key after delay_ms, replacing an emit of key that is still pending.
+        A burst of changes thus reaches the listeners once, with the last arguments.
+        Emits immediately when the bus has no root widget to schedule on.
+        """
+        if self._root is None:
+            self.emit(key, *args, **kwargs)
+            return
+        after_id = self._pending.pop(key, None)
+        if after_id is not None:
+            self._root.after_cancel(after_id)
+        self._pending[key] = self._root.after(delay_ms, self._emit_pending, key, args, kwargs)
+
+    def _emit_pending(self, key, args, kwargs):
+        """after() callback for emit_debounced."""
+        self._pending.pop(key, None)
+        self.emit(key, *args, **kwargs)
+
+    def emit(self, key, *args, **kwargs):
+        """Calls every listener of key with the given arguments. No-op when nobody listens."""
+        listeners = self._listeners.get(key)
+        if not listeners:
+            return
+        for callback in tuple(listeners): # Listeners may unsubscribe while being called
+            callback(*args, **kwargs)
+
+
+class ContextBound:
+    """
+    Mixin for frames that share the main frame's context.
+    The context is a types.SimpleNamespace (main, bus, io, options, action, queue)
+    owned by CleanVidMainFrame; attributes are filled in as the frames get built.
+    """
+    ctx = None
+
+    def bind_context(self, ctx):
+        """Attaches the shared frame context."""
+        self.ctx = ctx
+
+
+def context_reference(attr):
+    """
+    Class-level property for a sibling frame reference.
+    An explicitly assigned value wins; otherwise the frame stored as attr on the
+    instance's bound context is returned (None if neither is available).
+    """
+    key = f"_ref_{attr}"
+
+    def getter(self):
+        ref = self.__dict__.get(key)
+        if ref is None and self.ctx is not None:
+            ref = getattr(self.ctx, attr)
+        return ref
+
+    def setter(self, value):
+        self.__dict__[key] = value
+
+    return property(getter, setter, doc=f"Reference to the ctx.{attr} frame.")
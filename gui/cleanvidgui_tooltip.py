@@ -1,20 +1,107 @@
 import tkinter as tk
 import customtkinter as ctk # Import customtkinter for potential future use or consistency
 import sys # Import sys for platform check if needed
+from functools import partial
+
+def _resolve_text(text):
+    """Tooltip texts may be given as a callable, formatted only when the tooltip is actually shown."""
+    return text() if callable(text) else text
+
+# The one tooltip window of the app: created on first show, then withdrawn and reused.
+# Only one tooltip is ever visible, so every Tooltip/SharedTooltip shares it.
+_tooltip_win = None
+_tooltip_label = None
+_tooltip_owner = None # Tooltip/SharedTooltip currently showing the window
+
+def _show_window(owner, widget, text, x, y):
+    """Shows the shared tooltip window at (x, y) with text, on behalf of owner."""
+    global _tooltip_win, _tooltip_label, _tooltip_owner
+    try:
+        alive = _tooltip_win is not None and _tooltip_win.winfo_exists()
+    except tk.TclError: # Its Tk root was destroyed (e.g. a demo window closed and reopened)
+        alive = False
+    if not alive:
+        _tooltip_win = tk.Toplevel(widget._root())
+        _tooltip_win.withdraw()
+        _tooltip_win.wm_overrideredirect(True) # No window decorations
+        _tooltip_win.wm_attributes("-topmost", True) # Make it appear on top
+        _tooltip_label = tk.Label(_tooltip_win, justify='left',
+                                  background="#ffffe0", relief='solid', borderwidth=1,
+                                  wraplength=350, # Wrap long tooltips after 350 pixels
+                                  font=("tahoma", "8", "normal")) # Use a common font
+        _tooltip_label.pack(ipadx=2, ipady=2) # Add some internal padding
+    _tooltip_label.configure(text=text)
+    _tooltip_win.wm_geometry(f"+{x}+{y}")
+    _tooltip_win.deiconify()
+    _tooltip_owner = owner
+
+def _update_window(owner, text):
+    """Replaces the text of the shared window if owner is the one showing it."""
+    if _tooltip_owner is owner:
+        _tooltip_label.configure(text=text)
+
+def _hide_window(owner):
+    """Withdraws the shared window if owner is the one showing it."""
+    global _tooltip_owner
+    if _tooltip_owner is owner:
+        _tooltip_owner = None
+        try:
+            _tooltip_win.withdraw()
+        except tk.TclError:
+            pass
+
+# Tooltip events are bound once per Tk interpreter on this bindtag, which each Tooltip adds to its
+# widget(s), instead of three bind() calls per tooltip
+_BINDTAG = "CleanvidTooltip"
+_bound_interps = set() # id() of the Tk interpreters that already have the class bindings
+
+def _tooltip_for(widget):
+    """Returns the Tooltip of widget or its nearest ancestor that has one (CTk widgets are composites)."""
+    while widget is not None and not isinstance(widget, str):
+        tooltip = getattr(widget, "_bound_tooltip", None)
+        if tooltip is not None:
+            return tooltip
+        widget = widget.master
+    return None
+
+def _on_tag_enter(event):
+    tooltip = _tooltip_for(event.widget)
+    if tooltip is not None:
+        tooltip.schedule_tooltip(event)
+
+def _on_tag_leave(event):
+    tooltip = _tooltip_for(event.widget)
+    if tooltip is not None:
+        tooltip.hide_tooltip(event)
+
+def _ensure_class_bindings(widget):
+    """Binds the tooltip events on _BINDTAG, once per Tk interpreter."""
+    if id(widget.tk) not in _bound_interps:
+        root = widget._root()
+        root.bind_class(_BINDTAG, "<Enter>", _on_tag_enter)
+        root.bind_class(_BINDTAG, "<Leave>", _on_tag_leave)
+        root.bind_class(_BINDTAG, "<ButtonPress>", _on_tag_leave) # Hide on click
+        _bound_interps.add(id(widget.tk))
+
+def _attach(widget, tooltip):
+    """Routes widget's pointer events to tooltip (its schedule_tooltip/hide_tooltip) through _BINDTAG."""
+    _ensure_class_bindings(widget)
+    widget._bound_tooltip = tooltip
+    # CTk widgets receive pointer events on their inner Tk widgets, so those get the bindtag
+    for target in widget.winfo_children() or (widget,):
+        target.bindtags(target.bindtags() + (_BINDTAG,))
 
 class Tooltip:
     """
     Basic tooltip implementation for customtkinter widgets.
     Displays a text tooltip when the mouse hovers over a widget.
+    text may be a string or a callable returning one (called each time the tooltip is shown).
     """
     def __init__(self, widget, text):
         self.widget = widget
         self.text = text
-        self.tooltip_window = None
         self._after_id = None # To store the after() id
-        self.widget.bind("<Enter>", self.schedule_tooltip)
-        self.widget.bind("<Leave>", self.hide_tooltip)
-        self.widget.bind("<ButtonPress>", self.hide_tooltip) # Hide on click
+        _attach(widget, self)
 
     def schedule_tooltip(self, event=None):
         """Schedules the tooltip to be shown after a delay."""
@@ -27,30 +114,27 @@ class Tooltip:
 
     def show_tooltip(self):
         """Displays the tooltip window."""
-        # Check if mouse is still over the widget before showing
-        if self.widget.winfo_containing(self.widget.winfo_pointerx(), self.widget.winfo_pointery()) != self.widget:
+        widget = self.widget
+        # Check if mouse is still over the widget before showing. For CTk widgets the pointer is over
+        # one of their inner Tk widgets, so anything inside the widget counts.
+        hovered = widget.winfo_containing(*widget.winfo_pointerxy())
+        path = str(widget)
+        if hovered is None or not (str(hovered) == path or str(hovered).startswith(path + ".")):
             self.hide_tooltip() # Hide if mouse moved away during delay
             return
 
-        if self.tooltip_window or not self.text:
+        if _tooltip_owner is self:
+            return
+        text = _resolve_text(self.text)
+        if not text:
             return
 
         # Calculate position relative to the widget
         # Position the tooltip slightly below and centered horizontally on the widget
-        x = self.widget.winfo_rootx() + self.widget.winfo_width() // 2
-        y = self.widget.winfo_rooty() + self.widget.winfo_height() + 5 # 5 pixels below the widget
+        x = widget.winfo_rootx() + widget.winfo_width() // 2
+        y = widget.winfo_rooty() + widget.winfo_height() + 5 # 5 pixels below the widget
 
-        self.tooltip_window = tk.Toplevel(self.widget)
-        self.tooltip_window.wm_overrideredirect(True) # No window decorations
-        self.tooltip_window.wm_geometry(f"+{x}+{y}")
-        # Make it appear on top
-        self.tooltip_window.wm_attributes("-topmost", True)
-
-        label = tk.Label(self.tooltip_window, text=self.text, justify='left',
-                         background="#ffffe0", relief='solid', borderwidth=1,
-                         wraplength=350, # Wrap long tooltips after 350 pixels
-                         font=("tahoma", "8", "normal")) # Use a common font
-        label.pack(ipadx=2, ipady=2) # Add some internal padding
+        _show_window(self, widget, text, x, y)
 
     def hide_tooltip(self, event=None):
         """Hides the tooltip window and cancels any pending show schedule."""
@@ -58,10 +142,84 @@ class Tooltip:
         if self._after_id:
             self.widget.after_cancel(self._after_id)
             self._after_id = None
-        # Destroy the tooltip window if it exists
-        if self.tooltip_window:
-            self.tooltip_window.destroy()
-            self.tooltip_window = None
+        # Withdraw the shared tooltip window if it is showing this tooltip
+        _hide_window(self)
+
+class SharedTooltip:
+    """
+    One tooltip for many widgets (e.g. every row of a list), with texts kept in a path -> text dict.
+    Registered widgets get the same _BINDTAG class bindings as Tooltip, so only their own pointer
+    events reach it; no per-widget bind() calls and no bindings on the toplevel.
+    """
+    def __init__(self, owner, delay_ms=500):
+        self.owner = owner
+        self.delay_ms = delay_ms
+        self.texts = {} # str(widget) -> tooltip text, or a callable producing it on show
+        self._current = None # Path of the widget whose tooltip is shown or scheduled
+        self._after_id = None
+
+    def set_text(self, widget, text):
+        """Registers (or updates) the tooltip text for widget."""
+        if getattr(widget, "_bound_tooltip", None) is not self:
+            _attach(widget, self)
+        self.texts[str(widget)] = text
+        if self._current == str(widget):
+            _update_window(self, _resolve_text(text))
+
+    def forget(self, widget):
+        """Drops widget's tooltip text (call when the widget is destroyed)."""
+        if self.texts.pop(str(widget), None) is not None and self._current == str(widget):
+            self.hide_tooltip()
+
+    def _lookup(self, widget):
+        """Returns (path, text) of widget or its nearest ancestor with a registered text, else (None, None)."""
+        while widget is not None and not isinstance(widget, str):
+            path = str(widget)
+            if path in self.texts:
+                return path, self.texts[path]
+            widget = widget.master
+        return None, None
+
+    def schedule_tooltip(self, event):
+        """<Enter> on a registered widget: shows its tooltip after the delay, near the pointer."""
+        path, text = self._lookup(event.widget)
+        if path == self._current:
+            return # Still over the same widget
+        self.hide_tooltip()
+        if path is not None and text:
+            self._current = path
+            self._after_id = self.owner.after(self.delay_ms, self._show, event.x_root, event.y_root)
+
+    def _show(self, x, y):
+        """Displays the tooltip for the current widget near where the pointer was."""
+        self._after_id = None
+        text = _resolve_text(self.texts.get(self._current))
+        if not text:
+            return
+        _show_window(self, self.owner, text, x + 10, y + 15)
+
+    def hide_tooltip(self, event=None):
+        """Hides the tooltip and cancels any pending show."""
+        self._current = None
+        if self._after_id:
+            self.owner.after_cancel(self._after_id)
+            self._after_id = None
+        _hide_window(self)
+
+def lazy_tooltip(widget, text):
+    """
+    Registers tooltip text for a widget without building the Tooltip yet.
+    The Tooltip is constructed (and cached as widget._tooltip) on the first hover.
+    """
+    widget._tooltip = None
+    widget._tooltip_text = text
+    widget.bind("<Enter>", partial(_create_tooltip_on_enter, widget), add="+")
+
+def _create_tooltip_on_enter(widget, event=None):
+    """<Enter> handler installed by lazy_tooltip(); builds the real Tooltip once."""
+    if widget._tooltip is None:
+        widget._tooltip = Tooltip(widget, widget._tooltip_text)
+        widget._tooltip.schedule_tooltip(event) # Its own <Enter> binding only applies from the next hover
 
 # Example Usage (for testing purposes, can be removed later)
 if __name__ == "__main__":